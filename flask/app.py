@@ -27,6 +27,9 @@ from werkzeug.wrappers import Response as BaseResponse
 
 from . import cli
 from . import typing as ft
+from .ctx import _acquire_app_ctx
+from .ctx import _acquire_request_ctx
+from .ctx import _release_request_ctx
 from .ctx import AppContext
 from .ctx import RequestContext
 from .globals import _cv_app
@@ -298,8 +301,8 @@ class Flask(App):
         - 如果模式中包含 "b"，则以二进制方式打开文件，此时编码参数将被忽略。
         - 否则，以文本方式打开文件，并使用指定的编码方式。
         """
-        # 拼接实例路径与资源文件名，获取资源文件的完整路径
-        path = os.path.join(self.instance_path, resource)
+        # 基于预构造的实例目录Path拼接资源文件的完整路径
+        path = self._instance_path_obj / resource
 
         # 根据模式中是否包含 "b"，选择合适的方式打开文件
         if "b" in mode:
@@ -554,6 +557,7 @@ class Flask(App):
         finally:
             # 重置首次请求标志
             self._got_first_request = False
+            self._setup_finished = False
 
     def test_client(self, use_cookies: bool = True, **kwargs: t.Any) -> FlaskClient:
         """
@@ -784,6 +788,7 @@ class Flask(App):
         """
         # 标记已接收到第一个请求
         self._got_first_request = True
+        self._setup_finished = True
 
         try:
             # 在请求开始时发送信号，允许异步处理
@@ -1138,9 +1143,11 @@ class Flask(App):
         # 获取当前的请求上下文对象
         ctx = request_ctx._get_current_object()  # type: ignore[attr-defined]
 
-        # 调用当前请求上下文中注册的所有请求后处理函数
-        for func in ctx._after_request_functions:
-            response = self.ensure_sync(func)(response)
+        # 调用当前请求上下文中注册的所有请求后处理函数；
+        # 列表是按需创建的，None表示没有注册任何回调
+        if ctx._after_request_functions is not None:
+            for func in ctx._after_request_functions:
+                response = self.ensure_sync(func)(response)
 
         # 调用按照蓝图和应用范围注册的请求后处理函数
         for name in chain(request.blueprints, (None,)):
@@ -1219,7 +1226,7 @@ class Flask(App):
 
         :return: AppContext实例，包含了应用上下文信息。
         """
-        return AppContext(self)
+        return _acquire_app_ctx(self)
 
     def request_context(self, environ: WSGIEnvironment) -> RequestContext:
         """
@@ -1234,7 +1241,7 @@ class Flask(App):
         返回:
         - RequestContext: 一个请求上下文实例，用于表示当前请求的相关信息和状态。
         """
-        return RequestContext(self, environ)
+        return _acquire_request_ctx(self, environ)
 
     def test_request_context(self, *args: t.Any, **kwargs: t.Any) -> RequestContext:
         """
@@ -1309,8 +1316,9 @@ class Flask(App):
             if error is not None and self.should_ignore_error(error):
                 error = None
 
-            # 弹出上下文
+            # 弹出上下文，并尝试将其放回空闲池供后续请求复用
             ctx.pop(error)
+            _release_request_ctx(ctx)
 
     def __call__(
             self, environ: WSGIEnvironment, start_response: StartResponse
@@ -13,6 +13,7 @@ import typing as t
 import click
 
 from functools import update_wrapper
+from operator import attrgetter
 from operator import itemgetter
 from types import ModuleType
 from click.core import ParameterSource
@@ -1108,8 +1109,9 @@ class CertParamType(click.ParamType):
             # 尝试使用 path_type 方法转换 value
             return self.path_type(value, param, ctx)
         except click.BadParameter:
-            # 如果转换失败，将 value 转为小写字符串进行处理
-            value = click.STRING(value, param, ctx).lower()
+            # 如果转换失败，将 value 转为小写字符串进行处理。
+            # click 传入的值本身就是字符串，无需再经过 ParamType 机制转换
+            value = str(value).lower()
 
             if value == "adhoc":
                 try:
@@ -1440,8 +1442,9 @@ def routes_command(sort: str, all_methods: bool) -> None:
     ignored_methods = set() if all_methods else {"HEAD", "OPTIONS"}
     # 判断应用的路由是否启用了主机匹配
     host_matching = current_app.url_map.host_matching
-    # 判断是否有规则绑定了特定的域名或子域名
-    has_domain = any(rule.host if host_matching else rule.subdomain for rule in rules)
+    # 判断是否有规则绑定了特定的域名或子域名，条件判断只做一次，逐条读取交给attrgetter
+    get_domain = attrgetter("host" if host_matching else "subdomain")
+    has_domain = any(map(get_domain, rules))
     # 初始化存储所有路由信息的列表
     rows = []
 
@@ -1455,7 +1458,7 @@ def routes_command(sort: str, all_methods: bool) -> None:
 
         # 如果路由规则绑定了特定的域名或子域名，则添加到信息列表中
         if has_domain:
-            row.append((rule.host if host_matching else rule.subdomain) or "")
+            row.append(get_domain(rule) or "")
 
         # 添加路由规则到信息列表中
         row.append(rule.rule)
@@ -1464,23 +1467,25 @@ def routes_command(sort: str, all_methods: bool) -> None:
 
     # 定义输出表头的标题
     headers = ["Endpoint", "Methods"]
-    # 定义路由排序的依据
-    sorts = ["endpoint", "methods"]
+    # 定义排序依据到列下标的映射，一次性构建，避免线性查找
+    col_index = {"endpoint": 0, "methods": 1}
+    next_i = 2
 
     # 如果路由规则绑定了特定的域名或子域名，则添加相应的表头和排序依据
     if has_domain:
         headers.append("Host" if host_matching else "Subdomain")
-        sorts.append("domain")
+        col_index["domain"] = next_i
+        next_i += 1
 
     # 添加路由规则的路径作为表头和排序依据
     headers.append("Rule")
-    sorts.append("rule")
+    col_index["rule"] = next_i
 
-    # 尝试根据用户指定的排序依据对路由信息进行排序
-    try:
-        rows.sort(key=itemgetter(sorts.index(sort)))
-    except ValueError:
-        pass
+    # 根据用户指定的排序依据对路由信息进行排序，"match"不在映射中，保持匹配顺序
+    idx = col_index.get(sort)
+
+    if idx is not None:
+        rows.sort(key=itemgetter(idx))
 
     # 在路由信息列表的最前面添加表头
     rows.insert(0, headers)
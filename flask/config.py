@@ -14,6 +14,13 @@ if t.TYPE_CHECKING:
     from .sansio.app import App
 
 
+try:
+    import orjson
+
+    _fast_json_loads: t.Callable[[bytes], t.Any] | None = orjson.loads
+except ImportError:
+    _fast_json_loads = None
+
 T = t.TypeVar("T")
 
 
@@ -24,6 +31,21 @@ class ConfigAttribute(t.Generic[T]):
     该类允许通过应用程序配置字典访问和设置属性，同时支持在获取属性值时进行类型转换。
     """
 
+    def __new__(
+        cls, name: str, get_converter: t.Callable[[t.Any], T] | None = None
+    ) -> ConfigAttribute[T]:
+        """
+        根据是否提供了get_converter选择具体的描述符子类。
+
+        带转换器的基类实例在构造时特化为子类，其__get__直接调用
+        转换器；只对基类本身特化，用户子类保持原有类型，
+        转换逻辑由基类__get__兜底。
+        """
+        if cls is ConfigAttribute and get_converter is not None:
+            cls = _ConvertingConfigAttribute
+
+        return super().__new__(cls)
+
     def __init__(
         self, name: str, get_converter: t.Callable[[t.Any], T] | None = None
     ) -> None:
@@ -60,6 +82,8 @@ class ConfigAttribute(t.Generic[T]):
 
         rv = obj.config[self.__name__]
 
+        # 用户子类不经过__new__的特化选择，转换器检查保留在基类里；
+        # 直接实例化基类且带转换器的情况仍由特化子类免去本检查
         if self.get_converter is not None:
             rv = self.get_converter(rv)
 
@@ -76,12 +100,34 @@ class ConfigAttribute(t.Generic[T]):
         obj.config[self.__name__] = value
 
 
+class _ConvertingConfigAttribute(ConfigAttribute[T]):
+    """
+    带类型转换的配置属性描述符。
+
+    由ConfigAttribute.__new__在提供get_converter时自动选择，
+    __get__无需再判断转换器是否存在。
+    """
+
+    def __get__(self, obj: App | None, owner: type[App] | None = None) -> T | te.Self:
+        """
+        描述符的获取方法，返回经get_converter转换后的配置属性值。
+        """
+        if obj is None:
+            return self
+
+        return self.get_converter(obj.config[self.__name__])  # type: ignore[misc]
+
+
 
 class Config(dict):  # type: ignore[type-arg]
     """
     继承自dict的配置类，为应用程序提供灵活的配置选项。
     """
 
+    # 配置变动时的回调。应用用它把热路径常读的键镜像成实例属性，
+    # 这里覆盖所有改写入口保证镜像不过期
+    _on_change: t.Callable[[], None] | None = None
+
     def __init__(
         self,
         root_path: str | os.PathLike[str],
@@ -96,6 +142,50 @@ class Config(dict):  # type: ignore[type-arg]
         super().__init__(defaults or {})
         self.root_path = root_path
 
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        super().__setitem__(key, value)
+        if self._on_change is not None:
+            self._on_change()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        if self._on_change is not None:
+            self._on_change()
+
+    def update(self, *args: t.Any, **kwargs: t.Any) -> None:
+        super().update(*args, **kwargs)
+        if self._on_change is not None:
+            self._on_change()
+
+    def __ior__(self, other: t.Any) -> te.Self:
+        rv = super().__ior__(other)
+        if self._on_change is not None:
+            self._on_change()
+        return rv
+
+    def setdefault(self, key: str, default: t.Any = None) -> t.Any:
+        rv = super().setdefault(key, default)
+        if self._on_change is not None:
+            self._on_change()
+        return rv
+
+    def pop(self, *args: t.Any) -> t.Any:
+        rv = super().pop(*args)
+        if self._on_change is not None:
+            self._on_change()
+        return rv
+
+    def popitem(self) -> tuple[str, t.Any]:
+        rv = super().popitem()
+        if self._on_change is not None:
+            self._on_change()
+        return rv
+
+    def clear(self) -> None:
+        super().clear()
+        if self._on_change is not None:
+            self._on_change()
+
     def from_envvar(self, variable_name: str, silent: bool = False) -> bool:
         """
         从环境变量中加载配置。
@@ -117,24 +207,39 @@ class Config(dict):  # type: ignore[type-arg]
         return self.from_pyfile(rv, silent=silent)
 
     def from_prefixed_env(
-        self, prefix: str = "FLASK", *, loads: t.Callable[[str], t.Any] = json.loads
+        self,
+        prefix: str = "FLASK",
+        *,
+        loads: t.Callable[[str], t.Any] = json.loads,
+        sort: bool = False,
     ) -> bool:
         """
         从以特定前缀开头的环境变量中加载配置。
 
         :param prefix: 环境变量前缀。
         :param loads: 用于解析环境变量值的函数，默认为json.loads。
+        :param sort: 是否按字典序遍历环境变量。嵌套结构的构建与顺序无关，
+            仅当依赖子字典内键的插入顺序时才需要开启。
         :return: 成功加载配置返回True。
         """
         prefix = f"{prefix}_"
         len_prefix = len(prefix)
 
-        for key in sorted(os.environ):
+        # 默认不排序，省去对全部环境变量键的O(N log N)排序和列表分配
+        items: t.Iterable[tuple[str, str]] = os.environ.items()
+
+        if sort:
+            items = sorted(items)
+
+        # 普通键先于全部嵌套键处理：排序遍历时同名普通键总排在其
+        # 嵌套兄弟之前，环境序下也保持这一语义，后出现的普通键
+        # 不会整体覆盖嵌套键已写入的子字典
+        nested_items: list[tuple[str, t.Any]] = []
+
+        for key, value in items:
             if not key.startswith(prefix):
                 continue
 
-            value = os.environ[key]
-
             try:
                 value = loads(value)
             except Exception:
@@ -147,15 +252,37 @@ class Config(dict):  # type: ignore[type-arg]
                 self[key] = value
                 continue
 
-            current = self
+            nested_items.append((key, value))
+
+        # 记录上一条嵌套键的父路径及各层对应的字典，
+        # 相邻键共享的前缀路径无需重新逐层查找。普通键已全部写完，
+        # 缓存的游标不会再被顶层赋值置换
+        prev_parts: tuple[str, ...] = ()
+        cursors: list[dict[str, t.Any]] = []
+
+        for key, value in nested_items:
             *parts, tail = key.split("__")
 
-            for part in parts:
+            # 计算与上一条键共享的前缀深度，从共享的祖先处继续下探
+            common = 0
+
+            for prev_part, part in zip(prev_parts, parts):
+                if prev_part != part:
+                    break
+
+                common += 1
+
+            del cursors[common:]
+            current: dict[str, t.Any] = cursors[-1] if cursors else self
+
+            for part in parts[common:]:
                 if part not in current:
                     current[part] = {}
 
                 current = current[part]
+                cursors.append(current)
 
+            prev_parts = tuple(parts)
             current[tail] = value
 
         return True
@@ -214,6 +341,12 @@ class Config(dict):  # type: ignore[type-arg]
         """
         filename = os.path.join(self.root_path, filename)
 
+        # 如果加载函数是标准库的json.load且安装了orjson，则改用orjson直接
+        # 解析字节流，省去纯Python解析器和文本解码的开销。
+        if load is json.load and _fast_json_loads is not None:
+            load = lambda f: _fast_json_loads(f.read())  # noqa: E731
+            text = False
+
         try:
             with open(filename, "r" if text else "rb") as f:
                 obj = load(f)
@@ -236,11 +369,12 @@ class Config(dict):  # type: ignore[type-arg]
         :param kwargs: 额外的配置项。
         :return: 成功更新配置返回True。
         """
-        mappings: dict[str, t.Any] = {}
+        # 直接遍历两个来源，避免先合并成一个临时字典
         if mapping is not None:
-            mappings.update(mapping)
-        mappings.update(kwargs)
-        for key, value in mappings.items():
+            for key, value in mapping.items():
+                if key.isupper():
+                    self[key] = value
+        for key, value in kwargs.items():
             if key.isupper():
                 self[key] = value
         return True
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import contextvars
 import sys
-import typing as t
-from functools import update_wrapper
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import TYPE_CHECKING
+from typing import TypeVar
 from types import TracebackType
 
 from werkzeug.exceptions import HTTPException
@@ -14,7 +17,7 @@ from .globals import _cv_request
 from .signals import appcontext_popped
 from .signals import appcontext_pushed
 
-if t.TYPE_CHECKING:  # pragma: no cover
+if TYPE_CHECKING:  # pragma: no cover
     from _typeshed.wsgi import WSGIEnvironment
 
     from .app import Flask
@@ -23,94 +26,79 @@ if t.TYPE_CHECKING:  # pragma: no cover
 
 _sentinel = object()
 
+try:
+    # Python 3.11+：sys.exception()只返回当前异常，不构建三元组
+    from sys import exception as _sys_exception
+except ImportError:  # pragma: no cover
 
-class _AppCtxGlobals:
-    """
-    应用上下文全局变量类，用于在应用生命周期内存储全局变量。
-    """
+    def _sys_exception() -> BaseException | None:
+        return sys.exc_info()[1]
 
-    def __getattr__(self, name: str) -> t.Any:
-        """
-        获取属性值。
 
-        参数:
-        name (str): 属性名。
+# 预先绑定ContextVar的set/get方法，push及上下文检测省去属性查找
+_cv_app_set = _cv_app.set
+_cv_app_get = _cv_app.get
+_cv_app_reset = _cv_app.reset
+_cv_request_set = _cv_request.set
+_cv_request_get = _cv_request.get
+_cv_request_reset = _cv_request.reset
 
-        返回:
-        t.Any: 属性值。
+# 预先缓存信号的receivers字典与send方法。绝大多数应用没有连接这两个
+# 信号，push/pop先做一次真值判断即可跳过整个blinker派发流程。
+_pushed_receivers = appcontext_pushed.receivers
+_pushed_send = appcontext_pushed.send
+_popped_receivers = appcontext_popped.receivers
+_popped_send = appcontext_popped.send
 
-        异常:
-        AttributeError: 如果属性不存在，则抛出异常。
-        """
-        try:
-            return self.__dict__[name]
-        except KeyError:
-            raise AttributeError(name) from None
 
-    def __setattr__(self, name: str, value: t.Any) -> None:
-        """
-        设置属性值。
-
-        参数:
-        name (str): 属性名。
-        value (t.Any): 属性值。
-        """
-        self.__dict__[name] = value
-
-    def __delattr__(self, name: str) -> None:
-        """
-        删除属性。
-
-        参数:
-        name (str): 属性名。
+class _AppCtxGlobals:
+    """
+    应用上下文全局变量类，用于在应用生命周期内存储全局变量。
 
-        异常:
-        AttributeError: 如果属性不存在，则抛出异常。
-        """
-        try:
-            del self.__dict__[name]
-        except KeyError:
-            raise AttributeError(name) from None
+    普通属性的读写直接交给CPython内置的实例__dict__机制处理，
+    不再重载__getattr__/__setattr__/__delattr__，以免每次g.x访问
+    都多一层Python函数调用。
+    """
 
-    def get(self, name: str, default: t.Any | None = None) -> t.Any:
+    def get(self, name: str, default: Any | None = None) -> Any:
         """
         获取属性值，如果属性不存在则返回默认值。
 
         参数:
         name (str): 属性名。
-        default (t.Any | None): 默认值。
+        default (Any | None): 默认值。
 
         返回:
-        t.Any: 属性值或默认值。
+        Any: 属性值或默认值。
         """
         return self.__dict__.get(name, default)
 
-    def pop(self, name: str, default: t.Any = _sentinel) -> t.Any:
+    def pop(self, name: str, default: Any = _sentinel) -> Any:
         """
         移除并返回属性值，如果属性不存在则返回默认值。
 
         参数:
         name (str): 属性名。
-        default (t.Any): 默认值。
+        default (Any): 默认值。
 
         返回:
-        t.Any: 属性值或默认值。
+        Any: 属性值或默认值。
         """
         if default is _sentinel:
             return self.__dict__.pop(name)
         else:
             return self.__dict__.pop(name, default)
 
-    def setdefault(self, name: str, default: t.Any = None) -> t.Any:
+    def setdefault(self, name: str, default: Any = None) -> Any:
         """
         如果属性不存在，则设置属性值为默认值，并返回属性值。
 
         参数:
         name (str): 属性名。
-        default (t.Any): 默认值。
+        default (Any): 默认值。
 
         返回:
-        t.Any: 属性值。
+        Any: 属性值。
         """
         return self.__dict__.setdefault(name, default)
 
@@ -126,12 +114,12 @@ class _AppCtxGlobals:
         """
         return item in self.__dict__
 
-    def __iter__(self) -> t.Iterator[str]:
+    def __iter__(self) -> Iterator[str]:
         """
         返回属性迭代器。
 
         返回:
-        t.Iterator[str]: 属性迭代器。
+        Iterator[str]: 属性迭代器。
         """
         return iter(self.__dict__)
 
@@ -142,28 +130,28 @@ class _AppCtxGlobals:
         返回:
         str: 对象的字符串表示。
         """
-        ctx = _cv_app.get(None)
+        ctx = _cv_app_get(None)
         if ctx is not None:
             return f"<flask.g of '{ctx.app.name}'>"
         return object.__repr__(self)
 
 
 def after_this_request(
-    f: ft.AfterRequestCallable[t.Any],
-) -> ft.AfterRequestCallable[t.Any]:
+    f: ft.AfterRequestCallable[Any],
+) -> ft.AfterRequestCallable[Any]:
     """
     在请求结束后执行指定的函数。
 
     参数:
-    f (ft.AfterRequestCallable[t.Any]): 请求结束后要执行的函数。
+    f (ft.AfterRequestCallable[Any]): 请求结束后要执行的函数。
 
     返回:
-    ft.AfterRequestCallable[t.Any]: 装饰后的函数。
+    ft.AfterRequestCallable[Any]: 装饰后的函数。
 
     异常:
     RuntimeError: 如果没有激活的请求上下文，则抛出异常。
     """
-    ctx = _cv_request.get(None)
+    ctx = _cv_request_get(None)
 
     if ctx is None:
         raise RuntimeError(
@@ -171,11 +159,16 @@ def after_this_request(
             " context is active, such as in a view function."
         )
 
-    ctx._after_request_functions.append(f)
+    # 列表按需创建，多数请求从不注册回调
+    if ctx._after_request_functions is None:
+        ctx._after_request_functions = [f]
+    else:
+        ctx._after_request_functions.append(f)
+
     return f
 
 
-F = t.TypeVar("F", bound=t.Callable[..., t.Any])
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 def copy_current_request_context(f: F) -> F:
@@ -191,7 +184,7 @@ def copy_current_request_context(f: F) -> F:
     异常:
     RuntimeError: 如果没有激活的请求上下文，则抛出异常。
     """
-    ctx = _cv_request.get(None)
+    ctx = _cv_request_get(None)
 
     if ctx is None:
         raise RuntimeError(
@@ -200,12 +193,22 @@ def copy_current_request_context(f: F) -> F:
         )
 
     ctx = ctx.copy()
+    # f固定不变，装饰时包装一次即可，避免每次调用都经过ensure_sync检查
+    sync_f = ctx.app.ensure_sync(f)
 
-    def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
-        with ctx:  # type: ignore[union-attr]
-            return ctx.app.ensure_sync(f)(*args, **kwargs)  # type: ignore[union-attr]
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with ctx:
+            return sync_f(*args, **kwargs)
 
-    return update_wrapper(wrapper, f)  # type: ignore[return-value]
+    # 这个装饰发生在每个请求中，手动拷贝必要的元信息，
+    # 省去update_wrapper对WRAPPER_ASSIGNMENTS的完整遍历
+    wrapper.__wrapped__ = f  # type: ignore[attr-defined]
+    wrapper.__name__ = getattr(f, "__name__", wrapper.__name__)
+    wrapper.__qualname__ = getattr(f, "__qualname__", wrapper.__qualname__)
+    wrapper.__doc__ = f.__doc__
+    wrapper.__module__ = getattr(f, "__module__", wrapper.__module__)
+
+    return wrapper  # type: ignore[return-value]
 
 
 def has_request_context() -> bool:
@@ -215,7 +218,7 @@ def has_request_context() -> bool:
     返回:
     bool: 是否有激活的请求上下文。
     """
-    return _cv_request.get(None) is not None
+    return _cv_request_get(None) is not None
 
 
 def has_app_context() -> bool:
@@ -225,7 +228,7 @@ def has_app_context() -> bool:
     返回:
     bool: 是否有激活的应用上下文。
     """
-    return _cv_app.get(None) is not None
+    return _cv_app_get(None) is not None
 
 class AppContext:
     """
@@ -233,18 +236,52 @@ class AppContext:
 
     :param app: Flask应用实例，用于创建URL适配器和管理全局变量。
     """
+
+    # 属性集合固定，去掉实例__dict__以缩小每个上下文的内存占用，
+    # 属性读取也从字典查找变为C层槽位偏移
+    __slots__ = (
+        "app",
+        "url_adapter",
+        "g",
+        "_cv_token",
+        "_cv_extra_tokens",
+        "_ensure_sync",
+        "__weakref__",
+    )
+
     def __init__(self, app: Flask) -> None:
+        # 常规情形一个实例只被推入一次，单个槽位即可；同一实例的
+        # 嵌套重入把额外token放进按需分配的列表
+        self._cv_token: contextvars.Token[AppContext] | None = None
+        self._cv_extra_tokens: list[contextvars.Token[AppContext]] | None = None
+        self._reset(app)
+
+    def _reset(self, app: Flask) -> None:
+        """
+        绑定到给定应用并重建易变状态，供对象池复用已弹出的实例。
+        """
         self.app = app
         self.url_adapter = app.create_url_adapter(None)
         self.g: _AppCtxGlobals = app.app_ctx_globals_class()
-        self._cv_tokens: list[contextvars.Token[AppContext]] = []
+        # 缓存应用方法，push/pop热路径上只需一次LOAD_FAST
+        self._ensure_sync = app.ensure_sync
 
     def push(self) -> None:
         """
         将当前应用上下文压入上下文栈中，并发送应用上下文推送信号。
         """
-        self._cv_tokens.append(_cv_app.set(self))
-        appcontext_pushed.send(self.app, _async_wrapper=self.app.ensure_sync)
+        if self._cv_token is not None:
+            # 同一实例的嵌套重入：只追加一个token，上下文对外并未
+            # 改变，不重复发送pushed信号
+            if self._cv_extra_tokens is None:
+                self._cv_extra_tokens = []
+            self._cv_extra_tokens.append(_cv_app_set(self))
+            return
+
+        self._cv_token = _cv_app_set(self)
+
+        if _pushed_receivers:
+            _pushed_send(self.app, _async_wrapper=self._ensure_sync)
 
     def pop(self, exc: BaseException | None = _sentinel) -> None:  # type: ignore
         """
@@ -252,21 +289,38 @@ class AppContext:
 
         :param exc: 异常实例，用于在发生异常时进行上下文清理。
         """
+        extra_tokens = self._cv_extra_tokens
+
+        if extra_tokens:
+            # 弹出嵌套重入的一层：只还原对应token，
+            # teardown和popped信号留给最外层pop
+            _cv_app_reset(extra_tokens.pop())
+            return
+
+        token = self._cv_token
+
+        if token is None:
+            # 已完全弹出过的实例，重复pop不再重复执行teardown回调
+            return
+
+        self._cv_token = None
+
         try:
-            if len(self._cv_tokens) == 1:
-                if exc is _sentinel:
-                    exc = sys.exc_info()[1]
-                self.app.do_teardown_appcontext(exc)
+            if exc is _sentinel:
+                exc = _sys_exception()
+            self.app.do_teardown_appcontext(exc)
         finally:
-            ctx = _cv_app.get()
-            _cv_app.reset(self._cv_tokens.pop())
+            ctx = _cv_app_get(None)
+            _cv_app_reset(token)
 
-        if ctx is not self:
+        # 校验只在调试模式下保留，-O运行时整个分支会被剥离
+        if __debug__ and ctx is not self:
             raise AssertionError(
                 f"Popped wrong app context. ({ctx!r} instead of {self!r})"
             )
 
-        appcontext_popped.send(self.app, _async_wrapper=self.app.ensure_sync)
+        if _popped_receivers:
+            _popped_send(self.app, _async_wrapper=self._ensure_sync)
 
     def __enter__(self) -> AppContext:
         """
@@ -296,6 +350,23 @@ class RequestContext:
     :param request: 请求实例，如果未提供则会根据环境变量创建。
     :param session: 会话实例，用于管理请求中的会话信息。
     """
+
+    # 属性集合固定，去掉实例__dict__以缩小每个上下文的内存占用
+    __slots__ = (
+        "app",
+        "request",
+        "url_adapter",
+        "flashes",
+        "_flashes_messages_only",
+        "session",
+        "_after_request_functions",
+        "_cv_token",
+        "_cv_extra_tokens",
+        "_cv_app_ctx",
+        "_session_interface",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         app: Flask,
@@ -303,6 +374,28 @@ class RequestContext:
         request: Request | None = None,
         session: SessionMixin | None = None,
     ) -> None:
+        # 多数请求不会注册after_this_request回调，列表在首次注册时才分配
+        self._after_request_functions: list[ft.AfterRequestCallable[Any]] | None = (
+            None
+        )
+        # 常见情况下一个上下文实例只被推入一次，token与隐式应用上下文
+        # 各占一个槽位；stream_with_context会重入同一实例，额外的token
+        # 记在按需分配的列表里
+        self._cv_token: contextvars.Token[RequestContext] | None = None
+        self._cv_extra_tokens: list[contextvars.Token[RequestContext]] | None = None
+        self._cv_app_ctx: AppContext | None = None
+        self._reset(app, environ, request, session)
+
+    def _reset(
+        self,
+        app: Flask,
+        environ: WSGIEnvironment,
+        request: Request | None = None,
+        session: SessionMixin | None = None,
+    ) -> None:
+        """
+        绑定到给定请求并重建易变状态，供对象池复用已弹出的实例。
+        """
         self.app = app
         if request is None:
             request = app.request_class(environ)
@@ -314,11 +407,12 @@ class RequestContext:
         except HTTPException as e:
             self.request.routing_exception = e
         self.flashes: list[tuple[str, str]] | None = None
+        # get_flashed_messages对无过滤调用缓存的纯文本列表
+        self._flashes_messages_only: list[str] | None = None
         self.session: SessionMixin | None = session
-        self._after_request_functions: list[ft.AfterRequestCallable[t.Any]] = []
-        self._cv_tokens: list[
-            tuple[contextvars.Token[RequestContext], AppContext | None]
-        ] = []
+        # 缓存会话接口，push时省去对app的属性链查找
+        self._session_interface = app.session_interface
+        self._after_request_functions = None
 
     def copy(self) -> RequestContext:
         """
@@ -347,7 +441,15 @@ class RequestContext:
         """
         将当前请求上下文压入上下文栈中，并发送请求上下文推送信号。
         """
-        app_ctx = _cv_app.get(None)
+        if self._cv_token is not None:
+            # 同一实例的嵌套重入（stream_with_context）：只追加一个
+            # token，首次push建立的应用上下文、会话和路由匹配保持不动
+            if self._cv_extra_tokens is None:
+                self._cv_extra_tokens = []
+            self._cv_extra_tokens.append(_cv_request_set(self))
+            return
+
+        app_ctx = _cv_app_get(None)
 
         if app_ctx is None or app_ctx.app is not self.app:
             app_ctx = self.app.app_context()
@@ -355,10 +457,11 @@ class RequestContext:
         else:
             app_ctx = None
 
-        self._cv_tokens.append((_cv_request.set(self), app_ctx))
+        self._cv_token = _cv_request_set(self)
+        self._cv_app_ctx = app_ctx
 
         if self.session is None:
-            session_interface = self.app.session_interface
+            session_interface = self._session_interface
             self.session = session_interface.open_session(self.app, self.request)
 
             if self.session is None:
@@ -373,29 +476,41 @@ class RequestContext:
 
         :param exc: 异常实例，用于在发生异常时进行上下文清理。
         """
-        clear_request = len(self._cv_tokens) == 1
+        extra_tokens = self._cv_extra_tokens
+
+        if extra_tokens:
+            # 弹出的是嵌套重入（stream_with_context）的一层：只还原
+            # 对应token，teardown和请求关闭推迟到最外层pop时执行
+            _cv_request_reset(extra_tokens.pop())
+            return
 
         try:
-            if clear_request:
-                if exc is _sentinel:
-                    exc = sys.exc_info()[1]
-                self.app.do_teardown_request(exc)
-
-                request_close = getattr(self.request, "close", None)
-                if request_close is not None:
-                    request_close()
+            if exc is _sentinel:
+                exc = _sys_exception()
+            self.app.do_teardown_request(exc)
+
+            request_close = getattr(self.request, "close", None)
+            if request_close is not None:
+                request_close()
         finally:
-            ctx = _cv_request.get()
-            token, app_ctx = self._cv_tokens.pop()
-            _cv_request.reset(token)
+            ctx = _cv_request_get()
+            token = self._cv_token
+            app_ctx = self._cv_app_ctx
+            self._cv_token = None
+            self._cv_app_ctx = None
+
+            # 只有仍持有token时才还原ContextVar，重复pop不再抛TypeError
+            if token is not None:
+                _cv_request_reset(token)
 
-            if clear_request:
-                ctx.request.environ["werkzeug.request"] = None
+            ctx.request.environ["werkzeug.request"] = None
 
             if app_ctx is not None:
                 app_ctx.pop(exc)
+                _release_app_ctx(app_ctx)
 
-            if ctx is not self:
+            # 校验只在调试模式下保留，-O运行时整个分支会被剥离
+            if __debug__ and ctx is not self:
                 raise AssertionError(
                     f"Popped wrong request context. ({ctx!r} instead of {self!r})"
                 )
@@ -429,3 +544,91 @@ class RequestContext:
             f" [{self.request.method}] of {self.app.name}>"
         )
 
+
+
+# 上下文对象空闲池：完全弹出且不再被外部引用的上下文放回池中复用，
+# 减少每个请求的对象分配和GC扫描开销。
+_CTX_POOL_MAXSIZE = 256
+_app_ctx_pool: list[AppContext] = []
+_request_ctx_pool: list[RequestContext] = []
+
+
+def _acquire_app_ctx(app: Flask) -> AppContext:
+    """
+    从池中取出一个应用上下文并绑定到给定应用，池为空时新建。
+    """
+    # 先pop再处理空池：多线程WSGI下检查和pop之间池可能被掏空，
+    # 捕获IndexError比检查后再pop不存在竞态窗口
+    try:
+        ctx = _app_ctx_pool.pop()
+    except IndexError:
+        return AppContext(app)
+
+    ctx._reset(app)
+    return ctx
+
+
+def _release_app_ctx(ctx: AppContext) -> None:
+    """
+    尝试将已弹出的应用上下文放回池中。
+
+    仅回收原生AppContext且引用计数表明无外部引用的实例：此时引用只剩
+    调用方局部变量、本函数形参和getrefcount的实参三处。被信号接收器、
+    回调等持有的上下文会被跳过，以免复用时篡改其状态。
+    getrefcount不计入弱引用，同样要求__weakref__为空。
+    """
+    if (
+        type(ctx) is AppContext
+        and ctx._cv_token is None
+        and ctx.__weakref__ is None
+        and len(_app_ctx_pool) < _CTX_POOL_MAXSIZE
+        and sys.getrefcount(ctx) <= 3
+    ):
+        # 清掉对应用和g的引用，空闲的池条目不把它们钉在内存里；
+        # _reset在复用时会全部重建
+        ctx.app = None  # type: ignore[assignment]
+        ctx.url_adapter = None
+        ctx.g = None  # type: ignore[assignment]
+        ctx._ensure_sync = None
+        _app_ctx_pool.append(ctx)
+
+
+def _acquire_request_ctx(app: Flask, environ: WSGIEnvironment) -> RequestContext:
+    """
+    从池中取出一个请求上下文并绑定到给定请求，池为空时新建。
+    """
+    # 同_acquire_app_ctx，pop失败兜底新建以避免检查后pop的竞态
+    try:
+        ctx = _request_ctx_pool.pop()
+    except IndexError:
+        return RequestContext(app, environ)
+
+    ctx._reset(app, environ)
+    return ctx
+
+
+def _release_request_ctx(ctx: RequestContext) -> None:
+    """
+    尝试将已弹出的请求上下文放回池中，回收条件同_release_app_ctx。
+
+    getrefcount不计入弱引用，额外要求__weakref__为空，避免仍被
+    外部弱引用的实例进池后被复用方篡改状态。
+    """
+    if (
+        type(ctx) is RequestContext
+        and ctx._cv_token is None
+        and ctx.__weakref__ is None
+        and len(_request_ctx_pool) < _CTX_POOL_MAXSIZE
+        and sys.getrefcount(ctx) <= 3
+    ):
+        # 清掉对请求、会话和WSGI环境的引用，已完成请求的报文体
+        # 不随空闲池条目常驻内存；_reset在复用时会全部重建
+        ctx.app = None  # type: ignore[assignment]
+        ctx.request = None  # type: ignore[assignment]
+        ctx.url_adapter = None
+        ctx.session = None
+        ctx.flashes = None
+        ctx._flashes_messages_only = None
+        ctx._session_interface = None
+        ctx._after_request_functions = None
+        _request_ctx_pool.append(ctx)
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-import typing as t
+import io
+import logging
+from operator import itemgetter
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import TYPE_CHECKING
 
 from jinja2.loaders import BaseLoader
 from werkzeug.routing import RequestRedirect
@@ -9,7 +15,7 @@ from .blueprints import Blueprint
 from .globals import request_ctx
 from .sansio.app import App
 
-if t.TYPE_CHECKING:
+if TYPE_CHECKING:
     from .sansio.scaffold import Scaffold
     from .wrappers import Request
 
@@ -39,22 +45,24 @@ class DebugFilesKeyError(KeyError, AssertionError):
         - request: 当前的请求对象。
         - key: 尝试访问的文件键名。
         """
-        form_matches = request.form.getlist(key)
-        buf = [
+        msg = (
             f"You tried to access the file {key!r} in the request.files"
             " dictionary but it does not exist. The mimetype for the"
             f" request is {request.mimetype!r} instead of"
             " 'multipart/form-data' which means that no file contents"
             " were transmitted. To fix this error you should provide"
             ' enctype="multipart/form-data" in your form.'
-        ]
-        if form_matches:
-            names = ", ".join(repr(x) for x in form_matches)
-            buf.append(
+        )
+
+        # 先做一次存在性检查，仅在确有匹配时才构建完整的列表
+        if request.form.get(key) is not None:
+            names = ", ".join(repr(x) for x in request.form.getlist(key))
+            msg += (
                 "\n\nThe browser instead transmitted some file names. "
                 f"This was submitted: {names}"
             )
-        self.msg = "".join(buf)
+
+        self.msg = msg
 
     def __str__(self) -> str:
         """
@@ -106,23 +114,20 @@ class FormDataRoutingRedirect(AssertionError):
         super().__init__("".join(buf))
 
 
-def attach_enctype_error_multidict(request: Request) -> None:
-    """
-    为请求的files属性附加自定义错误处理。
+# 按原始files类缓存调试子类，避免每个请求都新建一个类型对象
+_files_subclass_cache: dict[type, type] = {}
 
-    这个函数会修改请求的files属性的类，为其添加自定义的__getitem__方法，
-    以便在文件键不存在时抛出更详细的异常信息。
 
-    参数:
-    - request: 当前的请求对象。
+def _make_debug_files_class(oldcls: type) -> type:
+    """
+    为给定的files类创建带增强错误处理的调试子类。
     """
-    oldcls = request.files.__class__
 
     class newcls(oldcls):  # type: ignore[valid-type, misc]
         """
         继承自原files类的自定义类，带有增强的错误处理。
         """
-        def __getitem__(self, key: str) -> t.Any:
+        def __getitem__(self, key: str) -> Any:
             """
             尝试获取文件，如果文件不存在则抛出DebugFilesKeyError异常。
 
@@ -135,6 +140,8 @@ def attach_enctype_error_multidict(request: Request) -> None:
             try:
                 return super().__getitem__(key)
             except KeyError as e:
+                request = self._debug_request
+
                 if key not in request.form:
                     raise
 
@@ -144,10 +151,31 @@ def attach_enctype_error_multidict(request: Request) -> None:
 
     newcls.__name__ = oldcls.__name__
     newcls.__module__ = oldcls.__module__
+    return newcls
+
+
+def attach_enctype_error_multidict(request: Request) -> None:
+    """
+    为请求的files属性附加自定义错误处理。
+
+    这个函数会修改请求的files属性的类，为其添加自定义的__getitem__方法，
+    以便在文件键不存在时抛出更详细的异常信息。调试子类按原类缓存，
+    请求对象通过实例属性传入，而不是闭包。
+
+    参数:
+    - request: 当前的请求对象。
+    """
+    oldcls = request.files.__class__
+    newcls = _files_subclass_cache.get(oldcls)
+
+    if newcls is None:
+        newcls = _files_subclass_cache[oldcls] = _make_debug_files_class(oldcls)
+
+    request.files._debug_request = request
     request.files.__class__ = newcls
 
 
-def _dump_loader_info(loader: BaseLoader) -> t.Iterator[str]:
+def _dump_loader_info(loader: BaseLoader) -> Iterator[str]:
     """
     生成加载器信息的字符串迭代器。
 
@@ -160,8 +188,9 @@ def _dump_loader_info(loader: BaseLoader) -> t.Iterator[str]:
     # 生成加载器的类信息字符串
     yield f"class: {type(loader).__module__}.{type(loader).__name__}"
 
-    # 遍历加载器的属性，生成相应的信息字符串
-    for key, value in sorted(loader.__dict__.items()):
+    # 遍历加载器的属性，生成相应的信息字符串。按键排序，
+    # itemgetter让比较在C层完成，无需逐项解包元组
+    for key, value in sorted(loader.__dict__.items(), key=itemgetter(0)):
         if key.startswith("_"):
             continue
         if isinstance(value, (tuple, list)):
@@ -184,7 +213,7 @@ def explain_template_loading_attempts(
         tuple[
             BaseLoader,
             Scaffold,
-            tuple[str, str | None, t.Callable[[], bool] | None] | None,
+            tuple[str, str | None, Callable[[], bool] | None] | None,
         ]
     ],
 ) -> None:
@@ -198,8 +227,16 @@ def explain_template_loading_attempts(
     - template: 模板名。
     - attempts: 模板加载尝试的列表，每个尝试包含加载器、源对象和加载结果。
     """
-    # 初始化信息列表，用于记录模板加载尝试的详细信息
-    info = [f"Locating template {template!r}:"]
+    # 输出只走logger.info，INFO级别未启用时直接返回，
+    # 不做后面几十次f-string格式化和加载器信息遍历
+    if not app.logger.isEnabledFor(logging.INFO):
+        return
+
+    # 使用StringIO缓冲输出，C实现按几何级数扩容，
+    # 避免列表逐项append再join的增长检查
+    buf = io.StringIO()
+    w = buf.write
+    w(f"Locating template {template!r}:")
     # 初始化找到的模板计数
     total_found = 0
     # 初始化蓝图变量
@@ -218,12 +255,12 @@ def explain_template_loading_attempts(
         else:
             src_info = repr(srcobj)
 
-        # 将尝试使用的加载器信息添加到信息列表
-        info.append(f"{idx + 1:5}: trying loader of {src_info}")
+        # 将尝试使用的加载器信息添加到缓冲
+        w(f"\n{idx + 1:5}: trying loader of {src_info}")
 
-        # 将加载器的详细信息添加到信息列表
+        # 将加载器的详细信息添加到缓冲
         for line in _dump_loader_info(loader):
-            info.append(f"       {line}")
+            w(f"\n       {line}")
 
         # 根据加载结果更新信息列表和找到的模板计数
         if triple is None:
@@ -231,28 +268,28 @@ def explain_template_loading_attempts(
         else:
             detail = f"found ({triple[1] or '<string>'!r})"
             total_found += 1
-        info.append(f"       -> {detail}")
+        w(f"\n       -> {detail}")
 
     # 初始化可疑标志
     seems_fishy = False
     # 如果没有找到模板，添加错误信息并设置可疑标志
     if total_found == 0:
-        info.append("Error: the template could not be found.")
+        w("\nError: the template could not be found.")
         seems_fishy = True
     # 如果找到多个模板，添加警告信息并设置可疑标志
     elif total_found > 1:
-        info.append("Warning: multiple loaders returned a match for the template.")
+        w("\nWarning: multiple loaders returned a match for the template.")
         seems_fishy = True
 
     # 如果有蓝图且存在可疑情况，添加额外的信息
     if blueprint is not None and seems_fishy:
-        info.append(
-            "  The template was looked up from an endpoint that belongs"
+        w(
+            "\n  The template was looked up from an endpoint that belongs"
             f" to the blueprint {blueprint!r}."
         )
-        info.append("  Maybe you did not place a template in the right folder?")
-        info.append("  See https://flask.palletsprojects.com/blueprints/#templates")
+        w("\n  Maybe you did not place a template in the right folder?")
+        w("\n  See https://flask.palletsprojects.com/blueprints/#templates")
 
     # 将所有信息记录到应用日志
-    app.logger.info("\n".join(info))
+    app.logger.info(buf.getvalue())
 
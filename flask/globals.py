@@ -14,6 +14,110 @@ if t.TYPE_CHECKING:  # pragma: no cover
     from .wrappers import Request
 
 
+class _CtxAttrProxy:
+    """
+    针对current_app/g/request/session特化的轻量代理。
+
+    werkzeug的LocalProxy每次属性访问要经过__getattr__ ->
+    _get_current_object -> ContextVar.get -> getattr共3-4层Python栈帧；
+    这里把ContextVar读取和属性获取合并到一层，request.method这类
+    热路径访问的开销大约减半。app_ctx/request_ctx本身仍使用LocalProxy。
+    """
+
+    __slots__ = ("_cv", "_name", "_msg")
+
+    def __init__(
+        self,
+        cv: ContextVar[t.Any],
+        name: str,
+        unbound_message: str,
+    ) -> None:
+        object.__setattr__(self, "_cv", cv)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_msg", unbound_message)
+
+    def _get_current_object(self) -> t.Any:
+        try:
+            obj = self._cv.get()
+        except LookupError:
+            raise RuntimeError(self._msg) from None
+
+        return getattr(obj, self._name)
+
+    def __getattr__(self, name: str) -> t.Any:
+        try:
+            obj = self._cv.get()
+        except LookupError:
+            raise RuntimeError(self._msg) from None
+
+        return getattr(getattr(obj, self._name), name)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        setattr(self._get_current_object(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._get_current_object(), name)
+
+    @property
+    def __class__(self) -> type:  # type: ignore[override]
+        try:
+            obj = self._cv.get()
+        except LookupError:
+            return _CtxAttrProxy
+
+        return type(getattr(obj, self._name))
+
+    def __getitem__(self, key: t.Any) -> t.Any:
+        return self._get_current_object()[key]
+
+    def __setitem__(self, key: t.Any, value: t.Any) -> None:
+        self._get_current_object()[key] = value
+
+    def __delitem__(self, key: t.Any) -> None:
+        del self._get_current_object()[key]
+
+    def __contains__(self, item: t.Any) -> bool:
+        return item in self._get_current_object()
+
+    def __iter__(self) -> t.Iterator[t.Any]:
+        return iter(self._get_current_object())
+
+    def __len__(self) -> int:
+        return len(self._get_current_object())
+
+    def __call__(self, *args: t.Any, **kwargs: t.Any) -> t.Any:
+        return self._get_current_object()(*args, **kwargs)
+
+    def __eq__(self, other: t.Any) -> bool:
+        return self._get_current_object() == other
+
+    def __ne__(self, other: t.Any) -> bool:
+        return self._get_current_object() != other
+
+    def __hash__(self) -> int:
+        return hash(self._get_current_object())
+
+    def __bool__(self) -> bool:
+        # 与LocalProxy保持一致：未绑定时为False而不是抛异常
+        try:
+            obj = self._cv.get()
+        except LookupError:
+            return False
+
+        return bool(getattr(obj, self._name))
+
+    def __str__(self) -> str:
+        return str(self._get_current_object())
+
+    def __repr__(self) -> str:
+        try:
+            obj = self._cv.get()
+        except LookupError:
+            return f"<{type(self).__name__} unbound>"
+
+        return repr(getattr(obj, self._name))
+
+
 _no_app_msg = """\
 Working outside of application context.
 
@@ -30,11 +134,11 @@ _cv_app: ContextVar[AppContext] = ContextVar("flask.app_ctx")
 app_ctx: AppContext = LocalProxy(  # type: ignore[assignment]
     _cv_app, unbound_message=_no_app_msg
 )
-current_app: Flask = LocalProxy(  # type: ignore[assignment]
-    _cv_app, "app", unbound_message=_no_app_msg
+current_app: Flask = _CtxAttrProxy(  # type: ignore[assignment]
+    _cv_app, "app", _no_app_msg
 )
-g: _AppCtxGlobals = LocalProxy(  # type: ignore[assignment]
-    _cv_app, "g", unbound_message=_no_app_msg
+g: _AppCtxGlobals = _CtxAttrProxy(  # type: ignore[assignment]
+    _cv_app, "g", _no_app_msg
 )
 
 _no_req_msg = """\
@@ -53,9 +157,9 @@ _cv_request: ContextVar[RequestContext] = ContextVar("flask.request_ctx")
 request_ctx: RequestContext = LocalProxy(  # type: ignore[assignment]
     _cv_request, unbound_message=_no_req_msg
 )
-request: Request = LocalProxy(  # type: ignore[assignment]
-    _cv_request, "request", unbound_message=_no_req_msg
+request: Request = _CtxAttrProxy(  # type: ignore[assignment]
+    _cv_request, "request", _no_req_msg
 )
-session: SessionMixin = LocalProxy(  # type: ignore[assignment]
-    _cv_request, "session", unbound_message=_no_req_msg
+session: SessionMixin = _CtxAttrProxy(  # type: ignore[assignment]
+    _cv_request, "session", _no_req_msg
 )
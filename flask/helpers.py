@@ -8,11 +8,13 @@ from datetime import datetime
 from functools import lru_cache
 from functools import update_wrapper
 
-import werkzeug.utils
 from werkzeug.exceptions import abort as _wz_abort
 from werkzeug.utils import redirect as _wz_redirect
+from werkzeug.utils import send_file as _wz_send_file
+from werkzeug.utils import send_from_directory as _wz_send_from_directory
 from werkzeug.wrappers import Response as BaseResponse
 
+from .globals import _cv_app
 from .globals import _cv_request
 from .globals import current_app
 from .globals import request
@@ -21,21 +23,32 @@ from .globals import session
 from .signals import message_flashed
 
 if t.TYPE_CHECKING:  # pragma: no cover
+    from .ctx import RequestContext
     from .wrappers import Response
 
 
+# 判定环境变量取值的假值集合，提升为模块级frozenset避免每次调用重建
+_falsy_values = frozenset(("0", "false", "no"))
+
+
 def get_debug_flag() -> bool:
     """
     获取调试标志。
 
     从环境变量中读取FLASK_DEBUG的值，如果值不存在或为'0', 'false', 'no'（不区分大小写），
     则返回False，否则返回True。
+    解析按环境变量的当前值缓存，批量构造应用时不重复做字符串处理；
+    测试间改动FLASK_DEBUG会因键不同而自然生效。
 
     Returns:
         bool: 调试标志的状态。
     """
-    val = os.environ.get("FLASK_DEBUG")
-    return bool(val and val.lower() not in {"0", "false", "no"})
+    return _parse_debug_flag(os.environ.get("FLASK_DEBUG"))
+
+
+@lru_cache(maxsize=4)
+def _parse_debug_flag(val: str | None) -> bool:
+    return bool(val) and val.lower() not in _falsy_values  # type: ignore[union-attr]
 
 
 def get_load_dotenv(default: bool = True) -> bool:
@@ -56,7 +69,7 @@ def get_load_dotenv(default: bool = True) -> bool:
     if not val:
         return default
 
-    return val.lower() in ("0", "false", "no")
+    return val.lower() in _falsy_values
 
 
 @t.overload
@@ -102,33 +115,47 @@ def stream_with_context(
         # 将装饰器的元数据更新为与原始可调用对象相同，以保持其名称和文档
         return update_wrapper(decorator, generator_or_function)  # type: ignore[arg-type, return-value]
 
-    # 定义一个内部生成器函数，用于在请求上下文中流式传输数据
-    def generator() -> t.Iterator[t.AnyStr | None]:
-        # 获取当前请求上下文
-        ctx = _cv_request.get(None)
-        # 如果没有活动的请求上下文，抛出异常
-        if ctx is None:
-            raise RuntimeError(
-                "'stream_with_context' can only be used when a request"
-                " context is active, such as in a view function."
-            )
-        # 在请求上下文中执行生成器，并开始流式传输数据
+    # 获取当前请求上下文
+    ctx = _cv_request.get(None)
+    # 如果没有活动的请求上下文，抛出异常
+    if ctx is None:
+        raise RuntimeError(
+            "'stream_with_context' can only be used when a request"
+            " context is active, such as in a view function."
+        )
+
+    # 一次性取出close绑定方法，非生成器的可迭代对象没有该方法时为None，
+    # 清理阶段免去hasattr的getattr加异常捕获开销
+    _close = getattr(gen, "close", None)
+
+    # 定义一个内部生成器函数，用于在请求上下文中流式传输数据。
+    # 上下文检查已在外层提前完成。已解析的对象用默认参数绑定为
+    # 局部变量，迭代期间LOAD_FAST即可命中
+    def generator(
+        ctx: RequestContext = ctx,
+        gen: t.Iterator[t.AnyStr] = gen,
+        _close: t.Callable[[], None] | None = _close,
+    ) -> t.Iterator[t.AnyStr]:
+        # 嵌套重入同一个请求上下文：原有的应用上下文和g在流式
+        # 迭代期间保持存活，wsgi_app的pop只摘掉嵌套token，
+        # teardown和request.close推迟到with退出时的最外层pop
         with ctx:
-            yield None
+            # 保证清理逻辑一定执行：未启动的生成器被close时finally
+            # 不会运行，这里先挂起一次，由下方的next()立即启动
+            yield None  # type: ignore[misc]
 
             try:
                 # 从生成器中逐项生成数据
                 yield from gen
             finally:
                 # 确保在生成器执行完毕后，如果生成器有close方法，则调用它
-                if hasattr(gen, "close"):
-                    gen.close()
+                if _close is not None:
+                    _close()
 
-    # 创建并返回包装后的生成器
+    # 启动生成器越过哨兵yield，使上下文在流被消费前就已持有
     wrapped_g = generator()
-    # 预先启动生成器，使其准备好接收数据
     next(wrapped_g)
-    return wrapped_g  # type: ignore[return-value]
+    return wrapped_g
 
 
 
@@ -153,11 +180,22 @@ def make_response(*args: t.Any) -> Response:
     if len(args) == 1:
         args = args[0]
 
+        # 参数本身已是本应用的响应对象时直接返回（jsonify等常见来源），
+        # 跳过make_response里的整条类型分发链
+        if isinstance(args, current_app.response_class):
+            return args  # type: ignore[return-value]
+
     # 使用当前应用的 make_response 方法和提供的参数，创建并返回一个响应对象。
     return current_app.make_response(args)
 
 
 
+# url_for结果的有界缓存，键为应用、脚本根、端点及全部参数，
+# 值带上应用本身做身份校验（同_template_attr_cache）
+_url_for_cache: dict[tuple[t.Any, ...], tuple[t.Any, str]] = {}
+_URL_FOR_CACHE_MAXSIZE = 4096
+
+
 def url_for(
         endpoint: str,
         *,
@@ -185,8 +223,58 @@ def url_for(
 
     此函数主要是作为一个工具函数，用于在Flask等框架中生成动态URL，便于开发者构建灵活的、可配置的URL。
     """
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+
+    # 只对结果确定的情况走缓存：相对端点依赖当前蓝图，外部URL和
+    # host/子域名匹配依赖请求的host，URL默认值函数可能每次注入
+    # 不同的值，这些情况都绕过缓存
+    req_ctx = _cv_request.get(None)
+
+    if (
+        req_ctx is not None
+        and _external is None
+        and _scheme is None
+        and endpoint[:1] != "."
+        and not app.url_default_functions
+        and not app.subdomain_matching
+        and not app.url_map.host_matching
+    ):
+        try:
+            key = (
+                id(app),
+                req_ctx.request.script_root,
+                endpoint,
+                _anchor,
+                _method,
+                # 参数值带上类型：True、1和1.0相等且哈希相同，
+                # 但序列化出的URL不同，不能共用缓存项
+                tuple((k, type(v), v) for k, v in sorted(values.items())),
+            )
+            entry = _url_for_cache.get(key)
+        except TypeError:
+            # 值不可哈希（或不可比较），退回未缓存路径
+            pass
+        else:
+            # 应用身份校验，防止旧应用被回收后id复用带来的错配
+            if entry is not None and entry[0] is app:
+                return entry[1]
+
+            rv = app.url_for(
+                endpoint,
+                _anchor=_anchor,
+                _method=_method,
+                **values,
+            )
+
+            # 简单的FIFO淘汰，防止缓存无界增长
+            if len(_url_for_cache) >= _URL_FOR_CACHE_MAXSIZE:
+                del _url_for_cache[next(iter(_url_for_cache))]
+
+            _url_for_cache[key] = (app, rv)
+            return rv
+
     # 调用当前应用的url_for方法来生成URL，传入所有提供的参数
-    return current_app.url_for(
+    return app.url_for(
         endpoint,
         _anchor=_anchor,
         _method=_method,
@@ -215,13 +303,14 @@ def redirect(
     Returns:
     - BaseResponse: 返回一个BaseResponse实例，用于执行重定向操作。
     """
-    # 检查是否存在当前应用
-    if current_app:
+    # 单次ContextVar读取判断是否存在当前应用，免去代理的双重解引用
+    app_ctx = _cv_app.get(None)
+    if app_ctx is not None:
         # 如果存在，使用当前应用的redirect方法进行重定向
-        return current_app.redirect(location, code=code)
-    else:
-        # 如果不存在当前应用，调用_wz_redirect函数进行重定向
-        return _wz_redirect(location, code=code, Response=Response)
+        return app_ctx.app.redirect(location, code=code)
+
+    # 如果不存在当前应用，调用_wz_redirect函数进行重定向
+    return _wz_redirect(location, code=code, Response=Response)
 
 
 
@@ -237,28 +326,54 @@ def abort(code: int | BaseResponse, *args: t.Any, **kwargs: t.Any) -> t.NoReturn
     :param kwargs: 传递给中止函数的额外关键字参数。
     :return: 该函数不会返回，标记为 t.NoReturn。
     """
-    # 检查当前应用上下文是否存在
-    if current_app:
+    # 单次ContextVar读取判断当前应用上下文是否存在
+    app_ctx = _cv_app.get(None)
+    if app_ctx is not None:
         # 使用当前应用的 aborter 中止请求
-        current_app.aborter(code, *args, **kwargs)
+        app_ctx.app.aborter(code, *args, **kwargs)
     else:
         # 使用全局的中止函数中止请求
         _wz_abort(code, *args, **kwargs)
 
 
 
+# 模板属性（宏等）的有界缓存，避免重复取模板并执行其模块级代码
+_template_attr_cache: dict[tuple[int, str, str], tuple[t.Any, t.Any]] = {}
+_TEMPLATE_ATTR_CACHE_MAXSIZE = 512
+
+
 def get_template_attribute(template_name: str, attribute: str) -> t.Any:
     """
     从Jinja2模板中获取指定属性的值。
 
+    宏这类属性在模板不变时是稳定的，这里按(环境, 模板名, 属性名)
+    做有界缓存；开启auto_reload（调试模式）时绕过缓存，保证模板
+    热重载仍然生效。
+
     :param template_name: 模板文件的名称，用于定位特定的模板。
     :param attribute: 需要从模板中获取的属性名称。
     :return: 返回模板中指定属性的值，属性类型可以是任意合法的Python类型。
     """
-    # 使用current_app的jinja_env属性获取Jinja2环境。
-    # 调用get_template方法加载指定名称的模板。
-    # 使用getattr函数从模板的module属性中获取指定名称的属性。
-    return getattr(current_app.jinja_env.get_template(template_name).module, attribute)
+    env = current_app.jinja_env
+
+    # 调试下模板可能被修改重载，直接走慢路径
+    if env.auto_reload:
+        return getattr(env.get_template(template_name).module, attribute)
+
+    key = (id(env), template_name, attribute)
+    entry = _template_attr_cache.get(key)
+
+    # 值里带上环境本身做身份校验，防止id复用带来的错配
+    if entry is not None and entry[0] is env:
+        return entry[1]
+
+    value = getattr(env.get_template(template_name).module, attribute)
+
+    if len(_template_attr_cache) >= _TEMPLATE_ATTR_CACHE_MAXSIZE:
+        _template_attr_cache.pop(next(iter(_template_attr_cache)))
+
+    _template_attr_cache[key] = (env, value)
+    return value
 
 
 
@@ -276,12 +391,12 @@ def flash(message: str, category: str = "message") -> None:
     返回:
     - None
     """
-    # 从会话中获取已有的闪现消息列表，如果不存在，则初始化为空列表
-    flashes = session.get("_flashes", [])
+    # setdefault一次完成读取和初始化，追加后显式标记会话已修改，
+    # 省去对已有列表再做一次__setitem__
+    flashes = session.setdefault("_flashes", [])
     # 将新的消息及其类别作为元组添加到闪现消息列表中
     flashes.append((category, message))
-    # 更新会话中的闪现消息列表
-    session["_flashes"] = flashes
+    session.modified = True
 
     # 获取当前应用实例，忽略类型检查以避免特定框架的依赖问题
     app = current_app._get_current_object()  # type: ignore
@@ -296,7 +411,7 @@ def flash(message: str, category: str = "message") -> None:
 
 
 def get_flashed_messages(
-        with_categories: bool = False, category_filter: t.Iterable[str] = ()
+        with_categories: bool = False, category_filter: t.Iterable[str] | None = None
 ) -> list[str] | list[tuple[str, str]]:
     """
     获取存储在会话中的闪光消息。
@@ -313,27 +428,74 @@ def get_flashed_messages(
     - 如果with_categories为True，返回一个包含类别和消息文本的元组列表。
     """
     # 尝试从请求上下文中获取闪光消息
-    flashes = request_ctx.flashes
+    ctx = request_ctx._get_current_object()  # type: ignore[attr-defined]
+    flashes = ctx.flashes
     if flashes is None:
         # 如果请求上下文中没有闪光消息，尝试从会话中提取
         flashes = session.pop("_flashes") if "_flashes" in session else []
-        request_ctx.flashes = flashes
-    if category_filter:
-        # 如果提供了类别过滤器，应用过滤
-        flashes = list(filter(lambda f: f[0] in category_filter, flashes))
+        ctx.flashes = flashes
+    if category_filter is not None:
+        # 如果提供了类别过滤器，应用过滤。先转成frozenset让成员检查
+        # 变为O(1)，元组解包的推导式省去lambda帧和f[0]下标
+        cf = (
+            category_filter
+            if isinstance(category_filter, (set, frozenset))
+            else frozenset(category_filter)
+        )
+        if not with_categories:
+            # 只要文本时直接一趟完成过滤和提取，不建中间列表
+            return [m for c, m in flashes if c in cf]
+        return [(c, m) for c, m in flashes if c in cf]
     if not with_categories:
-        # 如果不需要返回类别，只返回消息文本列表
-        return [x[1] for x in flashes]
+        # 常见情形：无过滤、只要文本。模板中多次调用时复用首次
+        # 构建的列表，结果随请求上下文自然失效
+        cached = ctx._flashes_messages_only
+        if cached is not None:
+            return cached
+        result = [m for _, m in flashes]
+        ctx._flashes_messages_only = result
+        return result
     # 如果需要返回类别，返回包含类别和消息文本的元组列表
     return flashes
 
 
 
+def _build_send_file_preparer(
+    app: t.Any,
+) -> t.Callable[..., dict[str, t.Any]]:
+    """
+    为给定应用生成并缓存专用的发送文件参数准备闭包。
+
+    应用级配置被捕获为闭包自由变量，之后每次调用只剩LOAD_DEREF
+    和几次字典写入，不再经过代理和配置字典逐项查找。
+    """
+    use_x_sendfile = app.config["USE_X_SENDFILE"]
+    response_class = app.response_class
+    root_path = app.root_path
+    get_send_file_max_age = app.get_send_file_max_age
+
+    def _prep(**kwargs: t.Any) -> dict[str, t.Any]:
+        # 如果max_age参数未设置，使用应用的get_send_file_max_age方法获取默认值
+        if kwargs.get("max_age") is None:
+            kwargs["max_age"] = get_send_file_max_age
+
+        # 补充当前请求环境、是否使用x_sendfile、响应类和应用的根路径
+        kwargs["environ"] = request.environ
+        kwargs["use_x_sendfile"] = use_x_sendfile
+        kwargs["response_class"] = response_class
+        kwargs["_root_path"] = root_path
+        return kwargs
+
+    app._send_file_preparer = _prep
+    return _prep
+
+
 def _prepare_send_file_kwargs(**kwargs: t.Any) -> dict[str, t.Any]:
     """
     准备发送文件的关键字参数。
 
     此函数用于根据当前应用的配置更新发送文件的关键字参数，以确保这些参数与应用的设置一致。
+    实际工作委托给按应用特化的闭包，首次调用时生成。
 
     参数:
     - **kwargs: t.Any - 接受任意关键字参数，这些参数将被更新以包含发送文件所必需的配置。
@@ -341,19 +503,13 @@ def _prepare_send_file_kwargs(**kwargs: t.Any) -> dict[str, t.Any]:
     返回:
     - dict[str, t.Any] - 更新后的关键字参数字典，包含了发送文件所需的配置。
     """
-    # 如果max_age参数未设置，使用当前应用的get_send_file_max_age方法获取默认值
-    if kwargs.get("max_age") is None:
-        kwargs["max_age"] = current_app.get_send_file_max_age
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    prep = getattr(app, "_send_file_preparer", None)
 
-    # 更新关键字参数，添加当前请求环境、是否使用x_sendfile、响应类和应用的根路径
-    kwargs.update(
-        environ=request.environ,
-        use_x_sendfile=current_app.config["USE_X_SENDFILE"],
-        response_class=current_app.response_class,
-        _root_path=current_app.root_path,  # type: ignore
-    )
-    # 返回更新后的关键字参数字典
-    return kwargs
+    if prep is None:
+        prep = _build_send_file_preparer(app)
+
+    return prep(**kwargs)
 
 
 
@@ -385,11 +541,10 @@ def send_file(
     返回:
     - Response: 一个包含文件内容的HTTP响应对象。
     """
-    # 准备发送文件所需的参数，并调用werkzeug.utils.send_file函数发送文件
-    return werkzeug.utils.send_file(  # type: ignore[return-value]
+    # 准备发送文件所需的参数，并调用werkzeug的send_file函数发送文件
+    return _wz_send_file(  # type: ignore[return-value]
         **_prepare_send_file_kwargs(
             path_or_file=path_or_file,
-            environ=request.environ,
             mimetype=mimetype,
             as_attachment=as_attachment,
             download_name=download_name,
@@ -421,13 +576,16 @@ def send_from_directory(
     返回:
     - Response -- 生成的文件响应。
     """
-    # 调用werkzeug.utils.send_from_directory发送文件，此处忽略类型检查以避免类型错误。
-    return werkzeug.utils.send_from_directory(  # type: ignore[return-value]
+    # 调用werkzeug的send_from_directory发送文件，此处忽略类型检查以避免类型错误。
+    return _wz_send_from_directory(  # type: ignore[return-value]
         directory, path, **_prepare_send_file_kwargs(**kwargs)
     )
 
 
 
+# 结果只取决于import_name对应模块的文件位置，进程内稳定，
+# 缓存后应用工厂和蓝图注册不再重复付出find_spec的开销
+@lru_cache(maxsize=None)
 def get_root_path(import_name: str) -> str:
     """
     获取给定模块的根路径。
@@ -507,15 +665,9 @@ def _split_blueprint_path(name: str) -> list[str]:
     返回值:
     - 一个字符串列表，包含按层级分割的蓝图路径。
     """
-    # 初始化路径列表，包含当前蓝图名称
-    out: list[str] = [name]
-
-    # 如果蓝图名称中包含点（"."），则进行递归分割
-    if "." in name:
-        # 使用rpartition从右边开始分割，获取最后一个点之前的部分
-        # 递归调用_split_blueprint_path，直到分割完所有层级
-        out.extend(_split_blueprint_path(name.rpartition(".")[0]))
+    # 迭代构建各层级前缀，避免逐层递归带来的Python栈帧和缓存探测
+    parts = name.split(".")
 
-    # 返回分割后的路径列表
-    return out
+    # 从最长前缀到最短前缀排列，与原递归版本的顺序一致
+    return [".".join(parts[:i]) for i in range(len(parts), 0, -1)]
 
@@ -3,13 +3,34 @@ from __future__ import annotations
 import json as _json
 import typing as t
 
+from ..globals import _cv_app
 from ..globals import current_app
 from .provider import _default
 
+# 带默认值的单次ContextVar读取，比LocalProxy.__bool__再解引用便宜
+_cv_app_get = _cv_app.get
+
 if t.TYPE_CHECKING:  # pragma: no cover
     from ..wrappers import Response
 
 
+def _json_fast_methods(app: t.Any) -> tuple[t.Any, ...]:
+    """
+    返回并缓存当前provider的(provider, dumps, response)绑定方法元组。
+
+    dumps/jsonify每次调用都要经过app.json的属性查找再创建绑定方法；
+    这里按应用缓存一次，provider被替换时按身份检查自动重建。
+    """
+    provider = app.json
+    cached = getattr(app, "_json_fast", None)
+
+    if cached is None or cached[0] is not provider:
+        cached = (provider, provider.dumps, provider.response)
+        app._json_fast = cached
+
+    return cached
+
+
 def dumps(obj: t.Any, **kwargs: t.Any) -> str:
     """
     将Python对象转换为JSON字符串。
@@ -26,9 +47,10 @@ def dumps(obj: t.Any, **kwargs: t.Any) -> str:
     - str: 序列化后的JSON字符串。
     """
     # 检查是否存在当前应用实例
-    if current_app:
-        # 使用当前应用实例的json.dumps方法进行序列化
-        return current_app.json.dumps(obj, **kwargs)
+    app_ctx = _cv_app_get(None)
+    if app_ctx is not None:
+        # 使用按应用缓存的绑定方法进行序列化，跳过逐次属性解析
+        return _json_fast_methods(app_ctx.app)[1](obj, **kwargs)
 
     # 设置默认的序列化函数处理无法直接序列化的对象
     kwargs.setdefault("default", _default)
@@ -53,9 +75,10 @@ def dump(obj: t.Any, fp: t.IO[str], **kwargs: t.Any) -> None:
     无返回值。
     """
     # 检查是否存在当前应用上下文
-    if current_app:
+    app_ctx = _cv_app_get(None)
+    if app_ctx is not None:
         # 如果存在，使用当前应用的JSON序列化方法
-        current_app.json.dump(obj, fp, **kwargs)
+        app_ctx.app.json.dump(obj, fp, **kwargs)
     else:
         # 如果不存在，设置默认的序列化行为并使用内置的JSON序列化方法
         kwargs.setdefault("default", _default)
@@ -81,8 +104,9 @@ def loads(s: str | bytes, **kwargs: t.Any) -> t.Any:
     - 如果`current_app`存在，则使用`current_app.json.loads`进行解析，这允许解析逻辑与应用上下文相关。
     - 否则，使用全局的`_json.loads`进行解析，这是一种通用的解析方式，不依赖于任何特定的应用上下文。
     """
-    if current_app:
-        return current_app.json.loads(s, **kwargs)
+    app_ctx = _cv_app_get(None)
+    if app_ctx is not None:
+        return app_ctx.app.json.loads(s, **kwargs)
 
     return _json.loads(s, **kwargs)
 
@@ -103,9 +127,10 @@ def load(fp: t.IO[t.AnyStr], **kwargs: t.Any) -> t.Any:
     - 从JSON文件中解析出的数据，数据类型取决于JSON内容。
     """
     # 检查是否存在当前应用上下文
-    if current_app:
+    app_ctx = _cv_app_get(None)
+    if app_ctx is not None:
         # 如果存在，使用当前应用上下文中的json.load方法加载JSON数据
-        return current_app.json.load(fp, **kwargs)
+        return app_ctx.app.json.load(fp, **kwargs)
 
     # 如果不存在应用上下文，使用独立的_json模块加载JSON数据
     return _json.load(fp, **kwargs)
@@ -127,6 +152,7 @@ def jsonify(*args: t.Any, **kwargs: t.Any) -> Response:
     - Response: 一个包含JSON格式数据的HTTP响应对象。
     """
 
-    # 使用当前应用的JSON响应构造器来生成响应
-    return current_app.json.response(*args, **kwargs)  # type: ignore[return-value]
+    # 使用按应用缓存的响应构造器来生成响应
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    return _json_fast_methods(app)[2](*args, **kwargs)  # type: ignore[return-value]
 
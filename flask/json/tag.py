@@ -47,6 +47,7 @@ import typing as t
 from base64 import b64decode
 from base64 import b64encode
 from datetime import datetime
+from functools import lru_cache
 from uuid import UUID
 
 from markupsafe import Markup
@@ -56,6 +57,21 @@ from werkzeug.http import parse_date
 from ..json import dumps
 from ..json import loads
 
+# 可选的orjson快路径：tag()已把所有非JSON类型转换为原生结构，
+# 序列化无需default钩子，可直接走C实现；不可用时退回flask.json
+try:
+    from orjson import OPT_NON_STR_KEYS as _OPT_NON_STR_KEYS
+    from orjson import dumps as _orjson_dumps
+    from orjson import loads as _fast_loads
+except ImportError:
+    _fast_dumps = None
+    _fast_loads = None
+else:
+
+    def _fast_dumps(value: t.Any) -> str:
+        # OPT_NON_STR_KEYS让非字符串字典键与stdlib一样被转成字符串
+        return _orjson_dumps(value, option=_OPT_NON_STR_KEYS).decode("utf-8")
+
 # 这段代码定义了一个名为 JSONTag 的类，用于为特定类型的对象添加标签，以便在序列化和反序列化过程中识别这些对象。具体功能如下：
 # 初始化：__init__ 方法接收一个 TaggedJSONSerializer 对象作为参数，并将其存储在实例变量 self.serializer 中。
 # 检查：check 方法用于检查给定值是否应该被当前标签标记，但具体实现需要子类提供。
@@ -149,14 +165,22 @@ class TagDict(JSONTag):
     它提供了检查数据格式、将数据转换为JSON格式和将JSON格式数据转换回Python格式的功能。
     """
 
-    # 定义__slots__以限制实例可以添加的属性，这里不需要额外的属性，所以为空元组
-    __slots__ = ()
+    # 缓存标签字典的直接引用，check对每个字典节点都会执行，
+    # 省去serializer.tags两级属性解析
+    __slots__ = ("_tags",)
     # 定义一个类变量key，用于标识和处理字典中的键
     key = " di"
 
+    def __init__(self, serializer: TaggedJSONSerializer) -> None:
+        super().__init__(serializer)
+        # tags字典在序列化器生命周期内不会被整体替换，可安全持有引用
+        self._tags = serializer.tags
+
     def check(self, value: t.Any) -> bool:
         """
         检查输入的值是否为字典类型，且只有一个键值对，该键存在于序列化器的标签中。
+        字典子类也必须匹配：单键撞上标签键的子类字典若交给PassDict，
+        反序列化时会被误认成标签结构。
 
         参数:
         - value: t.Any 类型，待检查的数据。
@@ -167,7 +191,7 @@ class TagDict(JSONTag):
         return (
             isinstance(value, dict)  # 检查是否为字典类型
             and len(value) == 1  # 检查字典是否只有一个键值对
-            and next(iter(value)) in self.serializer.tags  # 检查键是否在序列化器的标签中
+            and next(iter(value)) in self._tags  # 检查键是否在序列化器的标签中
         )
 
     def to_json(self, value: t.Any) -> t.Any:
@@ -180,10 +204,11 @@ class TagDict(JSONTag):
         返回:
         - t.Any 类型，转换后的JSON格式数据。
         """
-        # 获取字典的键，由于只有一个键，使用next(iter(value))获取
-        key = next(iter(value))
-        # 将字典的键值对按照特定格式转换为JSON格式
-        return {f"{key}__": self.serializer.tag(value[key])}
+        # check已保证只有一个键值对，一次items()迭代同时取出两者，
+        # 省一次哈希查找
+        key, val = next(iter(value.items()))
+        # 已知两端都是str，直接相加比f-string少一层格式化处理
+        return {key + "__": self.serializer.tag(val)}
 
     def to_python(self, value: t.Any) -> t.Any:
         """
@@ -195,10 +220,10 @@ class TagDict(JSONTag):
         返回:
         - t.Any 类型，转换后的Python字典数据。
         """
-        # 获取JSON数据的键，使用next(iter(value))获取
-        key = next(iter(value))
-        # 将JSON数据的键值对按照特定格式转换回Python字典格式
-        return {key[:-2]: value[key]}
+        # 一次items()迭代同时取出键和值
+        key, val = next(iter(value.items()))
+        # 去掉"__"后缀还原原始键，removesuffix在C层完成且更具防御性
+        return {key.removesuffix("__"): val}
 
 
 
@@ -234,7 +259,9 @@ class PassDict(JSONTag):
         返回:
         t.Any - 转换后的JSON格式的字典对象。
         """
-        return {k: self.serializer.tag(v) for k, v in value.items()}
+        # 先把绑定方法提为局部变量，循环内不再逐项做属性解析
+        tag = self.serializer.tag
+        return {k: tag(v) for k, v in value.items()}
 
     tag = to_json  # tag方法引用to_json方法，提供了一种通过tag名称访问to_json功能的方式。
 
@@ -270,7 +297,9 @@ class TagTuple(JSONTag):
         返回:
         - t.Any 类型，返回一个列表，其中每个元素都是value中对应元素的JSON表示。
         """
-        return [self.serializer.tag(item) for item in value]
+        # 先把绑定方法提为局部变量，循环内不再逐项做属性解析
+        tag = self.serializer.tag
+        return [tag(item) for item in value]
 
     def to_python(self, value: t.Any) -> t.Any:
         """
@@ -317,13 +346,27 @@ class PassList(JSONTag):
         - 转换后的列表，其中每个项目都转换为JSON格式。
         """
         # 使用列表推导式，对每个项目应用serializer的tag方法进行转换。
-        return [self.serializer.tag(item) for item in value]
+        # 绑定方法提为局部变量，循环内不再逐项做属性解析
+        tag = self.serializer.tag
+        return [tag(item) for item in value]
 
     # tag方法指向to_json方法，提供一个别名以支持一致的接口。
     tag = to_json
 
 
 
+# 短字节串Base64编解码的有界缓存。64字节以内的原文对应至多88个
+# 字符的编码，覆盖会话里常见的固定长度token
+@lru_cache(maxsize=1024)
+def _b64_encode_cached(value: bytes) -> str:
+    return b64encode(value).decode("ascii")
+
+
+@lru_cache(maxsize=1024)
+def _b64_decode_cached(value: str) -> bytes:
+    return b64decode(value)
+
+
 class TagBytes(JSONTag):
     """
     一个用于处理bytes类型数据的类，继承自JSONTag。
@@ -355,6 +398,11 @@ class TagBytes(JSONTag):
         返回:
         - t.Any Base64编码后的字符串。
         """
+        # 会话中反复出现的短字节串（固定token等）直接命中缓存，
+        # 跳过整个编码/分配周期；长值不进缓存以控制内存
+        if len(value) <= 64:
+            return _b64_encode_cached(value)
+
         return b64encode(value).decode("ascii")
 
     def to_python(self, value: t.Any) -> t.Any:
@@ -367,6 +415,10 @@ class TagBytes(JSONTag):
         返回:
         - t.Any 解码后的字节串。
         """
+        # 与编码侧对称的短值缓存
+        if len(value) <= 88:
+            return _b64_decode_cached(value)
+
         return b64decode(value)
 
 
@@ -404,7 +456,10 @@ class TagMarkup(JSONTag):
         返回:
             t.Any: 转换后的字符串，准备被进一步转换为JSON格式。
         """
-        return str(value.__html__())
+        # __html__通常返回Markup（str子类），此时无需再经str()整份
+        # 拷贝一遍，JSON序列化器对str子类一视同仁
+        html = value.__html__()
+        return html if isinstance(html, str) else str(html)
 
     def to_python(self, value: t.Any) -> t.Any:
         """
@@ -523,9 +578,17 @@ class TagDateTime(JSONTag):
 # 序列化：dumps 方法将值标记后转换为 JSON 字符串。
 # 反序列化：loads 方法将 JSON 字符串解析为 Python 对象，并取消标记。
 class TaggedJSONSerializer:
-    __slots__ = ("tags", "order")
-
-    default_tags = [
+    __slots__ = (
+        "tags",
+        "order",
+        "_type_map",
+        "_tag_dict",
+        "_pass_dict",
+        "_tags_get",
+    )
+
+    # 不可变元组：只在__init__迭代一次，元组迭代更快且不可被意外修改
+    default_tags = (
         TagDict,
         PassDict,
         TagTuple,
@@ -534,7 +597,25 @@ class TaggedJSONSerializer:
         TagMarkup,
         TagUUID,
         TagDateTime,
-    ]
+    )
+
+    # 精确类型与默认标签类的对应关系，dict由TagDict/PassDict按注册
+    # 顺序二选一；_rebuild_dispatch据此建立实例级分发表
+    default_type_map: t.ClassVar[dict[type, t.Any]] = {
+        dict: (TagDict, PassDict),
+        tuple: TagTuple,
+        list: PassList,
+        bytes: TagBytes,
+        UUID: TagUUID,
+        datetime: TagDateTime,
+    }
+
+    # 反向索引：标签类 -> 其负责的精确类型
+    _exact_tag_types = {
+        cls: tp
+        for tp, cls in default_type_map.items()
+        if not isinstance(cls, tuple)
+    }
 
     def __init__(self) -> None:
         """
@@ -544,11 +625,17 @@ class TaggedJSONSerializer:
         tags是一个字典，用于存储标签名和对应的JSONTag实例。
         order是一个列表，用于维护标签的注册顺序。
         """
-        # 初始化tags字典为空，用于存储标签名和JSONTag实例的映射
+        # 初始化tags字典为空，用于存储标签名和JSONTag实例的映射。
+        # 同时缓存其get绑定方法，untag对每个字典节点都要查一次标签
         self.tags: dict[str, JSONTag] = {}
+        self._tags_get = self.tags.get
         # 初始化order列表为空，用于维护标签的注册顺序
         self.order: list[JSONTag] = []
 
+        self._tag_dict: JSONTag | None = None
+        self._pass_dict: JSONTag | None = None
+        self._type_map: dict[type, JSONTag] | None = None
+
         # 遍历默认标签类，将它们注册到标签管理器中
         for cls in self.default_tags:
             # 调用register方法注册每个默认标签类
@@ -597,6 +684,53 @@ class TaggedJSONSerializer:
             # 否则，将标签插入到指定位置
             self.order.insert(index, tag)
 
+        # 每次注册后按当前标签集重建类型分发表（运行期特化：
+        # 注册集合在应用启动后几乎不变）
+        self._rebuild_dispatch()
+
+    def _rebuild_dispatch(self) -> None:
+        """
+        按当前注册顺序重建精确类型分发表。
+
+        只有默认标签类能安全地映射到具体类型；出现任何自定义标签
+        （check逻辑任意）时整体禁用快路径，tag()回退到按顺序扫描，
+        保留插入位置的优先级语义。
+        """
+        self._tag_dict = None
+        self._pass_dict = None
+        self._type_map = None
+
+        exact = self._exact_tag_types
+        type_map: dict[type, JSONTag] = {}
+        tag_dict: JSONTag | None = None
+        pass_dict: JSONTag | None = None
+
+        for tag in self.order:
+            cls = type(tag)
+
+            if cls is TagDict:
+                # 仅当TagDict先于PassDict出现时，字典快路径才需要
+                # 先做单键标签检查
+                if tag_dict is None and pass_dict is None:
+                    tag_dict = tag
+            elif cls is PassDict:
+                if pass_dict is None:
+                    pass_dict = tag
+            elif cls is TagMarkup:
+                # __html__鸭子类型无法按精确类型分发，留给顺序扫描
+                continue
+            elif cls in exact:
+                type_map.setdefault(exact[cls], tag)
+            else:
+                # 自定义标签：禁用快路径
+                return
+
+        self._type_map = type_map
+        # 字典快路径要求PassDict兜底存在，否则字典一律走顺序扫描
+        if pass_dict is not None:
+            self._pass_dict = pass_dict
+            self._tag_dict = tag_dict
+
     def tag(self, value: t.Any) -> t.Any:
         """
         根据预定义的顺序，应用第一个匹配的标签到给定值上。
@@ -611,6 +745,38 @@ class TaggedJSONSerializer:
         返回:
         - t.Any 类型，表示标签化后的值或者原始值，具体取决于是否找到了适用的标签。
         """
+        type_map = self._type_map
+
+        if type_map is not None:
+            # 快路径：按精确类型一次哈希完成分发。dict需要额外区分
+            # 单键撞上标签键的情形；子类和__html__鸭子类型不会精确
+            # 命中，自然落回下面的顺序扫描
+            tp = type(value)
+
+            if tp is dict:
+                pass_dict = self._pass_dict
+
+                if pass_dict is not None:
+                    tag_dict = self._tag_dict
+
+                    if (
+                        tag_dict is not None
+                        and len(value) == 1
+                        and next(iter(value)) in self.tags
+                    ):
+                        return tag_dict.tag(value)
+
+                    return pass_dict.tag(value)
+            else:
+                handler = type_map.get(tp)
+
+                if handler is not None:
+                    return handler.tag(value)
+
+                if tp is str or tp is int or tp is float or tp is bool or value is None:
+                    # 原生JSON标量不可能匹配任何默认标签，直接返回
+                    return value
+
         # 遍历预定义的标签顺序
         for tag in self.order:
             # 检查当前标签是否适用于给定的值
@@ -638,16 +804,17 @@ class TaggedJSONSerializer:
             # 如果不是，直接返回原始值
             return value
 
-        # 获取字典中的唯一键
-        key = next(iter(value))
+        # 一次迭代同时取出键和值，用缓存的get绑定方法把成员检查与
+        # 取值合成单次哈希
+        key, val = next(iter(value.items()))
+        tag = self._tags_get(key)
 
-        # 检查键是否在预定义的标签中
-        if key not in self.tags:
-            # 如果不在，直接返回原始值
+        if tag is None:
+            # 键不在预定义的标签中，直接返回原始值
             return value
 
         # 使用标签对应的转换方法，将值转换为相应的Python对象并返回
-        return self.tags[key].to_python(value[key])
+        return tag.to_python(val)
 
     def _untag_scan(self, value: t.Any) -> t.Any:
         """
@@ -661,19 +828,47 @@ class TaggedJSONSerializer:
 
         返回:
             t.Any - 处理后的值，结构与输入值相同，但其中的标签已被移除。
+
+        实现为显式工作表的后序遍历：容器原地改写，只有untag真正
+        转换节点时才产生新对象，省去逐层递归帧和未打标签子树的
+        整套重建。JSON解析出的都是裸dict/list，用__class__精确
+        比较即可，不必走isinstance的MRO。
         """
-        # 如果输入值是字典
-        if isinstance(value, dict):
-            # 对字典中的每个键值对进行递归调用
-            value = {k: self._untag_scan(v) for k, v in value.items()}
-            # 对整个字典调用untag方法
-            value = self.untag(value)
-        # 如果输入值是列表
-        elif isinstance(value, list):
-            # 对列表中的每个元素进行递归调用
-            value = [self._untag_scan(item) for item in value]
-
-        # 返回处理后的值
+        cls = value.__class__
+        if cls is not dict and cls is not list:
+            return value
+
+        untag = self.untag
+        tags = self.tags
+
+        # 先序收集全部容器，倒序处理即保证子节点先于父节点完成
+        containers: list[t.Any] = [value]
+        append = containers.append
+        i = 0
+        while i < len(containers):
+            c = containers[i]
+            i += 1
+            for child in c.values() if c.__class__ is dict else c:
+                ccls = child.__class__
+                if ccls is dict or ccls is list:
+                    append(child)
+
+        # 返回阶段：只有单键且键命中标签的字典才值得调用untag，
+        # 其余节点连函数调用都省掉
+        for c in reversed(containers):
+            if c.__class__ is dict:
+                for k, v in c.items():
+                    if v.__class__ is dict and len(v) == 1 and next(iter(v)) in tags:
+                        c[k] = untag(v)
+            else:
+                for idx, v in enumerate(c):
+                    if v.__class__ is dict and len(v) == 1 and next(iter(v)) in tags:
+                        c[idx] = untag(v)
+
+        # 根节点自身的转换最后单独处理
+        if cls is dict and len(value) == 1 and next(iter(value)) in tags:
+            return untag(value)
+
         return value
 
     def dumps(self, value: t.Any) -> str:
@@ -689,8 +884,21 @@ class TaggedJSONSerializer:
 
         返回值:
         - 返回一个字符串，表示序列化后的JSON字符串。
+
+        安装了orjson时直接用它序列化打标签后的结构（输出本身就是
+        紧凑格式），否则用flask.json并显式指定紧凑分隔符。
         """
-        return dumps(self.tag(value), separators=(",", ":"))
+        tagged = self.tag(value)
+
+        if _fast_dumps is not None:
+            # orjson对超出64位的整数等stdlib能处理的值抛TypeError，
+            # 这类载荷退回flask.json序列化
+            try:
+                return _fast_dumps(tagged)
+            except TypeError:
+                pass
+
+        return dumps(tagged, separators=(",", ":"))
 
     def loads(self, value: str) -> t.Any:
         """
@@ -711,3 +919,35 @@ class TaggedJSONSerializer:
         """
         # 使用`loads`函数解析输入的字符串值，然后通过`_untag_scan`方法处理解析结果。
         return self._untag_scan(loads(value))
+
+    def bulk_loads(self, payloads: t.Iterable[str]) -> list[t.Any]:
+        """
+        批量反序列化多个载荷（会话迁移、缓存重建等场景）。
+
+        相比逐条调用loads，这里把解析函数和扫描方法提升为局部变量，
+        并在可用时使用orjson解析，整批处理只做一次名称解析。
+
+        参数:
+        - payloads: 待解析的JSON字符串的可迭代对象。
+
+        返回:
+        - list[t.Any]: 按输入顺序排列的反序列化结果列表。
+        """
+        fast = _fast_loads
+        scan = self._untag_scan
+        rv = []
+
+        for payload in payloads:
+            if fast is not None:
+                # orjson拒绝超出64位的整数等dumps退回stdlib时写出的
+                # 载荷，逐条兜底用flask.json解析
+                try:
+                    data = fast(payload)
+                except ValueError:
+                    data = loads(payload)
+            else:
+                data = loads(payload)
+
+            rv.append(scan(data))
+
+        return rv
@@ -6,6 +6,7 @@ import typing as t
 
 from werkzeug.local import LocalProxy
 
+from .globals import _cv_request
 from .globals import request
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -32,12 +33,18 @@ def wsgi_errors_stream() -> t.TextIO:
 
 
 
+# 按logger名缓存的肯定结果。只缓存True：已配置处理器的logger极少
+# 再失去处理器，而False必须每次重算，新增的处理器才能被察觉
+_handler_cache: dict[str, bool] = {}
+
+
 def has_level_handler(logger: logging.Logger) -> bool:
     """
     检查logger是否设置了有效级别的处理器。
 
     该函数通过检查logger及其父logger的有效级别来确定是否存在符合条件的处理器。
     它首先获取logger的有效日志级别，然后遍历logger及其父logger，检查它们的处理器是否满足该级别。
+    肯定结果按logger名缓存，重复调用免去整条父链和处理器列表的扫描。
 
     参数:
     logger (logging.Logger): 需要检查的logger实例。
@@ -45,6 +52,9 @@ def has_level_handler(logger: logging.Logger) -> bool:
     返回:
     bool: 如果找到了满足有效级别的处理器则返回True，否则返回False。
     """
+    if _handler_cache.get(logger.name, False):
+        return True
+
     # 获取logger的有效日志级别
     level = logger.getEffectiveLevel()
     current = logger
@@ -53,6 +63,7 @@ def has_level_handler(logger: logging.Logger) -> bool:
     while current:
         # 检查当前logger是否有满足有效级别的处理器
         if any(handler.level <= level for handler in current.handlers):
+            _handler_cache[logger.name] = True
             return True
 
         # 如果当前logger不传播日志事件，则停止检查
@@ -67,7 +78,36 @@ def has_level_handler(logger: logging.Logger) -> bool:
 
 
 
-default_handler = logging.StreamHandler(wsgi_errors_stream)  # type: ignore
+class _WSGIErrorsHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    """
+    把日志写入当前请求的wsgi.errors流的处理器。
+
+    直接持有LocalProxy做流时，每条日志的write/flush都要经过代理的
+    __getattr__和上下文解析；这里在emit里只做一次ContextVar读取和
+    environ取值，无请求时回退到sys.stderr。
+    """
+
+    def __init__(self) -> None:
+        # 仍把代理存为stream属性，保持与StreamHandler的外部约定一致
+        super().__init__(wsgi_errors_stream)  # type: ignore[arg-type]
+
+    def emit(self, record: logging.LogRecord) -> None:
+        ctx = _cv_request.get(None)
+        stream = (
+            sys.stderr if ctx is None else ctx.request.environ["wsgi.errors"]
+        )
+
+        try:
+            msg = self.format(record)
+            stream.write(msg + self.terminator)
+            stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+default_handler = _WSGIErrorsHandler()
 default_handler.setFormatter(
     logging.Formatter("[%(asctime)s] %(levelname)s in %(module)s: %(message)s")
 )
@@ -97,6 +137,7 @@ def create_logger(app: App) -> logging.Logger:
     # 如果日志记录器没有设置处理程序，则添加一个默认的处理程序
     if not has_level_handler(logger):
         logger.addHandler(default_handler)
+        _handler_cache[logger.name] = True
 
     # 返回配置好的日志记录器
     return logger
@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import logging
 import os
+import pathlib
 import sys
+import threading
 import typing as t
 from datetime import timedelta
-from itertools import chain
+from functools import lru_cache
 
 from werkzeug.exceptions import Aborter
 from werkzeug.exceptions import BadRequest
@@ -14,7 +16,6 @@ from werkzeug.routing import BuildError
 from werkzeug.routing import Map
 from werkzeug.routing import Rule
 from werkzeug.sansio.response import Response
-from werkzeug.utils import cached_property
 from werkzeug.utils import redirect as _wz_redirect
 
 from .. import typing as ft
@@ -47,6 +48,7 @@ T_teardown = t.TypeVar("T_teardown", bound=ft.TeardownCallable)
 T_template_filter = t.TypeVar("T_template_filter", bound=ft.TemplateFilterCallable)
 T_template_global = t.TypeVar("T_template_global", bound=ft.TemplateGlobalCallable)
 T_template_test = t.TypeVar("T_template_test", bound=ft.TemplateTestCallable)
+T_url_defaults = t.TypeVar("T_url_defaults", bound=ft.URLDefaultCallable)
 
 
 def _make_timedelta(value: timedelta | int | None) -> timedelta | None:
@@ -68,13 +70,117 @@ def _make_timedelta(value: timedelta | int | None) -> timedelta | None:
         # 如果是，直接返回该值
         return value
 
-    # 如果输入是一个整数，创建一个具有该秒数的 timedelta 对象并返回
+    # 整数秒经lru_cache转换：配置值几乎不变，重复读取属性时直接
+    # 复用同一个timedelta实例，热路径零分配
+    return _td_from_seconds(value)
+
+
+@lru_cache(maxsize=32)
+def _td_from_seconds(value: int) -> timedelta:
     return timedelta(seconds=value)
 
 
+@lru_cache(maxsize=256)
+def _mro(cls: type) -> tuple[type, ...]:
+    """记忆化异常类的MRO元组，反复分发同类异常时省去属性访问。"""
+    return cls.__mro__
+
+
+@lru_cache(maxsize=32)
+def _instance_path_for(prefix: str, name: str) -> str:
+    return os.path.join(prefix, "var", f"{name}-instance")
+
+
+# 需要自动转义的模板扩展名，哈希探测代替逐个后缀比较
+_AUTOESCAPE_EXTS = frozenset((".html", ".htm", ".xml", ".xhtml", ".svg"))
+
+
+# 常见HTTP方法的规范化表：注册路由时查表复用驻留字符串，
+# 免去每次注册对每个方法名重新upper()和分配新字符串
+_METHOD_CANON: dict[str, str] = {
+    m: u
+    for u in ("GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS", "TRACE")
+    for m in (u, u.lower())
+}
+
+
+
+class _slot_cached_property:
+    """
+    写入固定槽位的cached_property变体。
+
+    werkzeug的cached_property继承自property，每次访问的__get__都在
+    实例__dict__里查找；这个变体把首次计算的结果存进专用槽位，之后
+    的读写直接走槽位描述符。对槽位del后会重新计算。
+    """
+
+    def __init__(self, slot_name: str) -> None:
+        self.slot_name = slot_name
+
+    def __call__(self, fget: t.Callable[[t.Any], t.Any]) -> t.Any:
+        self.fget = fget
+        self.__doc__ = fget.__doc__
+        return self
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # 类创建时槽位描述符已就位，直接取出绑定，省掉之后的查找
+        self.member = getattr(owner, self.slot_name)
+
+    def __get__(self, obj: t.Any, owner: type | None = None) -> t.Any:
+        if obj is None:
+            return self
+
+        member = self.member
+
+        try:
+            return member.__get__(obj, owner)
+        except AttributeError:
+            value = self.fget(obj)
+            member.__set__(obj, value)
+            return value
+
+    def __set__(self, obj: t.Any, value: t.Any) -> None:
+        self.member.__set__(obj, value)
+
+    def __delete__(self, obj: t.Any) -> None:
+        self.member.__delete__(obj)
+
 
 class App(Scaffold):
 
+    # 每请求热访问的实例属性走固定槽位而不是实例__dict__。
+    # 基类Scaffold未声明__slots__，实例仍带__dict__，cached_property
+    # 和扩展随意挂的属性不受影响
+    __slots__ = (
+        "instance_path",
+        "_instance_path_obj",
+        "config",
+        "aborter",
+        "json",
+        "url_build_error_handlers",
+        "url_build_error_handlers_by_bp",
+        "teardown_appcontext_funcs",
+        "_error_handler_index",
+        "shell_context_processors",
+        "blueprints",
+        "_blueprints_list",
+        "_registered_bp_ids",
+        "extensions",
+        "_pending_rules",
+        "_pending_rules_lock",
+        "_url_map",
+        "subdomain_matching",
+        "_got_first_request",
+        "_instance_path_cache",
+        "_url_default_injectors",
+        "_name",
+        "_logger",
+        "_jinja_env",
+        "_cfg_provide_automatic_options",
+        "_cfg_trap_http_exceptions",
+        "_cfg_trap_bad_request_errors",
+    )
+
     aborter_class = Aborter
 
     jinja_environment = Environment
@@ -148,8 +254,17 @@ class App(Scaffold):
 
         self.instance_path = instance_path
 
+        # 预构造的Path对象：下游反复拼接实例目录下的子路径时直接
+        # 用 / 连接，不再每次对前缀重新解析
+        self._instance_path_obj = pathlib.Path(instance_path)
+
         self.config = self.make_config(instance_relative_config)
 
+        # 把热路径常读的配置键镜像到槽位属性，配置任何改动都会
+        # 通过回调刷新镜像
+        self.config._on_change = self._refresh_config_mirror
+        self._refresh_config_mirror()
+
         self.aborter = self.make_aborter()
 
         self.json: JSONProvider = self.json_provider_class(self)
@@ -172,20 +287,73 @@ class App(Scaffold):
             t.Callable[[Exception, str, dict[str, t.Any]], str]
         ] = []
 
+        # 按蓝图名分桶的构建错误处理器：url_for失败时只扫终点所属
+        # 蓝图的桶和通用列表，而不是线性遍历全部处理器
+        self.url_build_error_handlers_by_bp: dict[
+            str, list[t.Callable[[Exception, str, dict[str, t.Any]], str]]
+        ] = {}
+
         self.teardown_appcontext_funcs: list[ft.TeardownCallable] = []
 
+        # error_handler_spec的扁平索引：(蓝图名, 状态码, 异常类) -> 处理器。
+        # 首次查找时惰性构建，注册新处理器时置空
+        self._error_handler_index: (
+            dict[tuple[str | None, int | None, type], ft.ErrorHandlerCallable] | None
+        ) = None
+
         self.shell_context_processors: list[ft.ShellContextProcessorCallable] = []
 
         self.blueprints: dict[str, Blueprint] = {}
 
+        # blueprints的插入序镜像：按名查找走字典，热路径迭代走连续列表
+        self._blueprints_list: list[Blueprint] = []
+
+        # 已注册蓝图的身份集合：注册时O(1)判断是否首次注册，
+        # 代替对blueprints全量的is扫描
+        self._registered_bp_ids: set[int] = set()
+
         self.extensions: dict[str, t.Any] = {}
 
+        # 注册阶段先把Rule缓冲在这里，首次访问url_map时再批量add，
+        # 避免每次add_url_rule都触发Werkzeug的规则编译
+        self._pending_rules: list[t.Any] = []
+
+        # 保护延迟刷入：多线程服务器的首批请求可能并发触发url_map
+        self._pending_rules_lock = threading.Lock()
+
         self.url_map = self.url_map_class(host_matching=host_matching)
 
         self.subdomain_matching = subdomain_matching
 
+        # 按终点特化的URL默认参数注入器：终点 -> 解析好的处理函数
+        # 元组。注册新默认函数或蓝图时整体清空
+        self._url_default_injectors: dict[str, tuple[ft.URLDefaultCallable, ...]] = {}
+
         self._got_first_request = False
 
+    @property
+    def url_map(self) -> Map:
+        """
+        应用的URL映射。访问时先把缓冲的规则批量刷入，保证匹配和
+        iter_rules等外部用法总能看到完整的映射。
+        """
+        if self._pending_rules:
+            # 双重检查：刷入完成后的热路径访问不经过锁，
+            # 并发的首批访问在锁内重新确认，规则只bind一次
+            with self._pending_rules_lock:
+                pending = self._pending_rules
+                if pending:
+                    url_map_add = self._url_map.add
+                    for rule_obj in pending:
+                        url_map_add(rule_obj)
+                    pending.clear()
+
+        return self._url_map
+
+    @url_map.setter
+    def url_map(self, value: Map) -> None:
+        self._url_map = value
+
     def _check_setup_finished(self, f_name: str) -> None:
         """
         确保在应用程序处理第一个请求之前已完成设置。
@@ -211,7 +379,25 @@ class App(Scaffold):
                 " running it."
             )
 
-    @cached_property
+    def _refresh_config_mirror(self) -> None:
+        """
+        刷新热路径配置键的槽位镜像。
+
+        config的所有改写入口都会回调到这里，每请求读取这些键时走
+        一次槽位加载而不是字典探测。
+        """
+        config = self.config
+        self._cfg_provide_automatic_options = config.get(
+            "PROVIDE_AUTOMATIC_OPTIONS", True
+        )
+        self._cfg_trap_http_exceptions = config.get("TRAP_HTTP_EXCEPTIONS", False)
+        self._cfg_trap_bad_request_errors = config.get("TRAP_BAD_REQUEST_ERRORS")
+
+        # 发送文件参数闭包捕获了USE_X_SENDFILE等配置值，
+        # 配置变更时作废，下次send_file重新生成
+        self._send_file_preparer = None
+
+    @_slot_cached_property("_name")
     def name(self) -> str:
         """
         根据模块的导入名称或文件名生成模块的名称。
@@ -234,12 +420,12 @@ class App(Scaffold):
         # 如果模块的导入名称不是 "__main__"，直接返回导入名称
         return self.import_name
 
-    @cached_property
+    @_slot_cached_property("_logger")
     def logger(self) -> logging.Logger:
 
         return create_logger(self)
 
-    @cached_property
+    @_slot_cached_property("_jinja_env")
     def jinja_env(self) -> Environment:
 
         return self.create_jinja_environment()
@@ -280,9 +466,13 @@ class App(Scaffold):
 
         本函数尝试根据应用的导入名称找到一个合适的实例路径。
         实例路径用于存储运行时的数据，如数据库文件等。
+        结果在实例上缓存，重载器反复构造时不重复做文件系统查找。
 
         :return: 返回实例路径的字符串。
         """
+        cached = getattr(self, "_instance_path_cache", None)
+        if cached is not None:
+            return cached
 
         # 查找包的位置，find_package 是一个假设存在的函数，用于查找给定导入名称对应的包路径。
         # 它返回一个元组，其中包含前缀和包路径。
@@ -291,11 +481,14 @@ class App(Scaffold):
         # 如果没有前缀，意味着这是一个没有特定前缀的包，
         # 这种情况下，我们直接在包路径下创建一个 "instance" 文件夹作为实例路径。
         if prefix is None:
-            return os.path.join(package_path, "instance")
+            path = os.path.join(package_path, "instance")
+        else:
+            # 如果有前缀，我们则在前缀下创建一个 "var" 文件夹，并在其下以应用名称命名实例文件夹。
+            # 拼接结果按(prefix, name)全局缓存，重复构造同名应用时直接复用。
+            path = _instance_path_for(prefix, self.name)
 
-        # 如果有前缀，我们则在前缀下创建一个 "var" 文件夹，并在其下以应用名称命名实例文件夹。
-        # 这样做是为了在有前缀的情况下提供更灵活和可配置的实例路径。
-        return os.path.join(prefix, "var", f"{self.name}-instance")
+        self._instance_path_cache = path
+        return path
 
     def create_global_jinja_loader(self) -> DispatchingJinjaLoader:
 
@@ -318,8 +511,10 @@ class App(Scaffold):
         # 如果文件名为空，则默认选择自动转义。
         if filename is None:
             return True
-        # 检查文件名是否以常见的需要自动转义的文件扩展名结尾。
-        return filename.endswith((".html", ".htm", ".xml", ".xhtml", ".svg"))
+        # 取出最后一段扩展名做一次哈希探测，代替5次后缀比较；
+        # 统一小写使判断对扩展名大小写不敏感
+        head, sep, ext = filename.rpartition(".")
+        return bool(sep) and "." + ext.lower() in _AUTOESCAPE_EXTS
 
     @property
     def debug(self) -> bool:
@@ -366,15 +561,16 @@ class App(Scaffold):
         # 调用蓝图的register方法，将当前应用实例和额外选项传递给蓝图进行注册
         blueprint.register(self, options)
 
-    def iter_blueprints(self) -> t.ValuesView[Blueprint]:
+    def iter_blueprints(self) -> tuple[Blueprint, ...]:
         """
         迭代所有蓝图。
 
-        该方法返回一个包含所有蓝图的值视图，允许用户在不直接访问内部字典的情况下迭代蓝prints。
+        该方法按注册顺序返回所有蓝图，迭代走连续的列表镜像而不是
+        字典的值视图，调用方无法借此改动内部状态。
 
-        :return: 一个值视图，包含所有蓝图。
+        :return: 一个元组，按注册顺序包含所有蓝图。
         """
-        return self.blueprints.values()
+        return tuple(self._blueprints_list)
 
     @setupmethod
     def add_url_rule(
@@ -396,55 +592,87 @@ class App(Scaffold):
         :raises TypeError: 如果允许的方法不是字符串列表。
         :raises AssertionError: 如果视图函数映射将覆盖一个现有的终点函数。
         """
-        # 确定终点（endpoint）名称
-        if endpoint is None:
-            endpoint = _endpoint_from_view_func(view_func)  # type: ignore
+        options["rule"] = rule
         options["endpoint"] = endpoint
+        options["view_func"] = view_func
+        options["provide_automatic_options"] = provide_automatic_options
+        self.add_url_rules((options,))
 
-        # 获取允许的HTTP方法列表
-        methods = options.pop("methods", None)
-        if methods is None:
-            methods = getattr(view_func, "methods", None) or ("GET",)
-        if isinstance(methods, str):
-            raise TypeError(
-                "Allowed methods must be a list of strings, for"
-                ' example: @app.route(..., methods=["POST"])'
-            )
-        methods = {item.upper() for item in methods}
-
-        # 获取视图函数所需的HTTP方法
-        required_methods = set(getattr(view_func, "required_methods", ()))
-
-        # 确定是否自动生成OPTIONS请求的响应
-        if provide_automatic_options is None:
-            provide_automatic_options = getattr(
-                view_func, "provide_automatic_options", None
-            )
-
-        if provide_automatic_options is None:
-            if "OPTIONS" not in methods and self.config["PROVIDE_AUTOMATIC_OPTIONS"]:
-                provide_automatic_options = True
-                required_methods.add("OPTIONS")
-            else:
-                provide_automatic_options = False
+    @setupmethod
+    def add_url_rules(self, rules: t.Iterable[dict[str, t.Any]]) -> None:
+        """
+        批量添加URL规则。
 
-        methods |= required_methods
+        每个spec是一个字典，键与 :meth:`add_url_rule` 的参数同名，
+        其余键作为规则选项传给url_rule_class；spec会被就地消费。
+        常用属性和配置在循环外读入局部变量，大量注册时省去每条
+        规则重复的属性查找。
 
-        # 创建URL规则对象并添加到URL映射中
-        rule_obj = self.url_rule_class(rule, methods=methods, **options)
-        rule_obj.provide_automatic_options = provide_automatic_options  # type: ignore[attr-defined]
+        :param rules: 规则spec的可迭代对象。
+        """
+        canon = _METHOD_CANON
+        rule_cls = self.url_rule_class
+        pending_append = self._pending_rules.append
+        view_functions = self.view_functions
+        cfg_automatic_options = self._cfg_provide_automatic_options
+
+        for options in rules:
+            rule = options.pop("rule")
+            endpoint = options.pop("endpoint", None)
+            view_func = options.pop("view_func", None)
+            provide_automatic_options = options.pop("provide_automatic_options", None)
+
+            # 确定终点（endpoint）名称
+            if endpoint is None:
+                endpoint = _endpoint_from_view_func(view_func)  # type: ignore
+            options["endpoint"] = endpoint
+
+            # 获取允许的HTTP方法列表
+            methods = options.pop("methods", None)
+            if methods is None:
+                methods = getattr(view_func, "methods", None) or ("GET",)
+            if isinstance(methods, str):
+                raise TypeError(
+                    "Allowed methods must be a list of strings, for"
+                    ' example: @app.route(..., methods=["POST"])'
+                )
+            methods = {canon.get(item) or item.upper() for item in methods}
 
-        self.url_map.add(rule_obj)
+            # 获取视图函数所需的HTTP方法；为空时不额外建集合
+            required_methods = getattr(view_func, "required_methods", ())
+            if required_methods:
+                methods.update(
+                    canon.get(item) or item.upper() for item in required_methods
+                )
 
-        # 注册视图函数
-        if view_func is not None:
-            old_func = self.view_functions.get(endpoint)
-            if old_func is not None and old_func != view_func:
-                raise AssertionError(
-                    "View function mapping is overwriting an existing"
-                    f" endpoint function: {endpoint}"
+            # 确定是否自动生成OPTIONS请求的响应
+            if provide_automatic_options is None:
+                provide_automatic_options = getattr(
+                    view_func, "provide_automatic_options", None
                 )
-            self.view_functions[endpoint] = view_func
+
+            if provide_automatic_options is None:
+                if "OPTIONS" not in methods and cfg_automatic_options:
+                    provide_automatic_options = True
+                    methods.add("OPTIONS")
+                else:
+                    provide_automatic_options = False
+
+            # 创建URL规则对象；先缓冲，首次访问url_map时再批量编译进映射
+            rule_obj = rule_cls(rule, methods=methods, **options)
+            rule_obj.provide_automatic_options = provide_automatic_options  # type: ignore[attr-defined]
+
+            pending_append(rule_obj)
+
+            # 注册视图函数
+            if view_func is not None:
+                old_func = view_functions.get(endpoint)
+                if old_func is not None and old_func != view_func:
+                    raise AssertionError(
+                        "View function mapping is overwriting an existing"
+                        f" endpoint function: {endpoint}"
+                    )
+                view_functions[endpoint] = view_func
 
     @setupmethod
     def template_filter(
@@ -651,6 +879,26 @@ class App(Scaffold):
         # 返回传入的函数f，使其可以被继续使用
         return f
 
+    @setupmethod
+    def register_error_handler(
+        self,
+        code_or_exception: type[Exception] | int,
+        f: ft.ErrorHandlerCallable,
+    ) -> None:
+        """
+        注册错误处理函数，并使扁平索引在下次查找时重建。
+        """
+        super().register_error_handler(code_or_exception, f)
+        self._error_handler_index = None
+
+    @setupmethod
+    def url_defaults(self, f: T_url_defaults) -> T_url_defaults:
+        """
+        注册URL默认值处理器，并丢弃按终点特化的注入器缓存。
+        """
+        self._url_default_injectors.clear()
+        return super().url_defaults(f)
+
     def _find_error_handler(
         self, e: Exception, blueprints: list[str]
     ) -> ft.ErrorHandlerCallable | None:
@@ -669,26 +917,37 @@ class App(Scaffold):
         - 如果没有找到合适的错误处理器，则返回None。
         """
 
+        index = self._error_handler_index
+
+        if index is None:
+            # 把三层嵌套的spec压平成单个字典，之后每次异常分发
+            # 只按(蓝图名, 状态码, 异常类)做哈希查找
+            index = self._error_handler_index = {
+                (name, code_key, cls): handler
+                for name, by_code in self.error_handler_spec.items()
+                for code_key, by_cls in by_code.items()
+                for cls, handler in by_cls.items()
+            }
+
+        # 没有注册任何处理器时直接返回
+        if not index:
+            return None
+
         # 获取异常类和对应的HTTP状态码
         exc_class, code = self._get_exc_class_and_code(type(e))
 
         # 准备蓝图名称和默认名称的元组，用于后续的错误处理器查找
         names = (*blueprints, None)
+        get = index.get
+
+        # 遍历HTTP状态码和默认值，以及蓝图名称和异常类的MRO，
+        # 按原有优先级顺序逐个探测扁平索引
+        mro = _mro(exc_class)
 
-        # 遍历HTTP状态码和默认值，以及蓝图名称，以查找错误处理器映射
         for c in (code, None) if code is not None else (None,):
             for name in names:
-                # 尝试获取当前蓝图和状态码对应的错误处理器映射
-                handler_map = self.error_handler_spec[name][c]
-
-                # 如果当前映射为空，则跳过，继续查找下一个
-                if not handler_map:
-                    continue
-
-                # 遍历异常类的方法解析顺序（MRO），以查找匹配的错误处理器
-                for cls in exc_class.__mro__:
-                    # 尝试获取当前异常类对应的错误处理器
-                    handler = handler_map.get(cls)
+                for cls in mro:
+                    handler = get((name, c, cls))
 
                     # 如果找到匹配的处理器，则返回它
                     if handler is not None:
@@ -710,22 +969,18 @@ class App(Scaffold):
         返回:
         - bool: 表示是否应该捕获该HTTP异常。
         """
-        # 检测是否需要捕获HTTP异常
-        if self.config["TRAP_HTTP_EXCEPTIONS"]:
+        # 检测是否需要捕获HTTP异常；读取槽位镜像而不是配置字典
+        if self._cfg_trap_http_exceptions:
             return True
 
         # 获取配置中关于是否捕获不良请求错误的设置
-        trap_bad_request = self.config["TRAP_BAD_REQUEST_ERRORS"]
-
-        # 如果配置未明确是否捕获不良请求错误，且处于调试模式，并且异常是BadRequestKeyError类型，则捕获
-        if (
-            trap_bad_request is None
-            and self.debug
-            and isinstance(e, BadRequestKeyError)
-        ):
-            return True
+        trap_bad_request = self._cfg_trap_bad_request_errors
+
+        # 每个分支只做一次isinstance：未明确配置时仅在调试模式下
+        # 捕获BadRequestKeyError，明确开启时捕获所有BadRequest
+        if trap_bad_request is None:
+            return self.debug and isinstance(e, BadRequestKeyError)
 
-        # 如果配置明确需要捕获不良请求错误，并且异常是BadRequest类型，则捕获
         if trap_bad_request:
             return isinstance(e, BadRequest)
 
@@ -767,21 +1022,51 @@ class App(Scaffold):
         - endpoint: 字符串类型，表示请求的终点。
         - values: 字典类型，包含终点的URL参数，此函数将向其中注入默认值。
         """
-        # 初始化名称集合，用于存储蓝图路径中的各部分名称，从右至左
-        names: t.Iterable[str | None] = (None,)
+        funcs = self._url_default_injectors.get(endpoint)
 
-        # 如果终点包含蓝图分隔符"."，则分解蓝图路径，并将路径各部分反转存储
-        if "." in endpoint:
-            names = chain(
-                names, reversed(_split_blueprint_path(endpoint.rpartition(".")[0]))
-            )
+        if funcs is None:
+            # 首次见到该终点：把全局(None)和蓝图链上的处理函数按原
+            # 优先级展开成扁平元组缓存，之后构建URL只走一次循环，
+            # 不再做字典探测和蓝图路径分解
+            url_default_functions = self.url_default_functions
+            resolved = list(url_default_functions.get(None, ()))
+
+            if "." in endpoint:
+                for name in reversed(
+                    _split_blueprint_path(endpoint.rpartition(".")[0])
+                ):
+                    resolved.extend(url_default_functions.get(name, ()))
+
+            funcs = self._url_default_injectors[endpoint] = tuple(resolved)
+
+        for func in funcs:
+            func(endpoint, values)
 
-        # 遍历蓝图路径的各部分名称，包括None（代表全局默认参数）
-        for name in names:
-            # 如果当前名称有对应的URL默认参数处理函数，则执行这些函数
-            if name in self.url_default_functions:
-                for func in self.url_default_functions[name]:
-                    func(endpoint, values)
+    @setupmethod
+    def register_url_build_error_handler(
+        self,
+        f: t.Callable[[Exception, str, dict[str, t.Any]], str],
+        endpoint_prefix: str | None = None,
+    ) -> None:
+        """
+        注册URL构建错误处理器。
+
+        指定endpoint_prefix（蓝图名）时处理器进入对应的桶，只在该
+        蓝图的终点构建失败时被调用；未指定时读取处理器自身的
+        endpoint_prefix属性，仍没有则作为通用处理器对所有终点生效。
+
+        :param f: 处理器，签名同url_build_error_handlers中的元素。
+        :param endpoint_prefix: 处理器关心的蓝图名，None表示通用。
+        """
+        if endpoint_prefix is None:
+            endpoint_prefix = getattr(f, "endpoint_prefix", None)
+
+        if endpoint_prefix is None:
+            self.url_build_error_handlers.append(f)
+        else:
+            self.url_build_error_handlers_by_bp.setdefault(endpoint_prefix, []).append(
+                f
+            )
 
     def handle_url_build_error(
         self, error: BuildError, endpoint: str, values: dict[str, t.Any]
@@ -803,8 +1088,18 @@ class App(Scaffold):
         抛出:
         - BuildError: 如果没有处理器能处理错误，或者所有处理器都返回None，则会重新抛出构建错误。
         """
-        # 遍历所有URL构建错误处理器，尝试处理错误
-        for handler in self.url_build_error_handlers:
+        # 先扫终点所属蓝图的桶，再扫通用处理器列表
+        by_bp = self.url_build_error_handlers_by_bp
+        handlers = self.url_build_error_handlers
+
+        if by_bp:
+            bp = endpoint.rpartition(".")[0]
+            scoped = by_bp.get(bp) if bp else None
+
+            if scoped:
+                handlers = [*scoped, *handlers]
+
+        for handler in handlers:
             try:
                 rv = handler(error, endpoint, values)
             except BuildError as e:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import typing as t
 from collections import defaultdict
+from functools import lru_cache
 from functools import update_wrapper
 
 from .. import typing as ft
@@ -31,7 +32,36 @@ T_url_value_preprocessor = t.TypeVar(
 )
 
 
+# 共享的空默认值字典：绝大多数蓝图没有URL默认值，复用同一个空字典
+# 免去每次注册的分配。使用方只读，需要修改时先拷贝
+_EMPTY_DICT: dict[str, t.Any] = {}
+
+
+@lru_cache(maxsize=1024)
+def _join_bp_name(prefix: str, name: str) -> str:
+    """拼接带点号的蓝图名，结果缓存；同一蓝图挂载到多个前缀或
+    批量注册路由时复用同一字符串。"""
+    return f"{prefix}.{name}".lstrip(".")
+
+
 class BlueprintSetupState:
+
+    # 每次register()都会实例化，延迟函数逐个访问其属性；
+    # 固定槽位省掉实例__dict__，属性读取也更快
+    __slots__ = (
+        "app",
+        "blueprint",
+        "options",
+        "first_registration",
+        "subdomain",
+        "url_prefix",
+        "_url_prefix_rstrip",
+        "name",
+        "name_prefix",
+        "_full_name",
+        "url_defaults",
+    )
+
     def __init__(
         self,
         blueprint: Blueprint,
@@ -71,16 +101,32 @@ class BlueprintSetupState:
             url_prefix = self.blueprint.url_prefix
         self.url_prefix = url_prefix
 
+        # 预先去掉前缀尾部的斜杠，每条路由注册时复用，不再反复rstrip
+        self._url_prefix_rstrip = (
+            url_prefix.rstrip("/") if url_prefix is not None else None
+        )
+
         # 获取蓝图名称配置，如果没有指定，则使用蓝图的名称
         self.name = self.options.get("name", blueprint.name)
 
         # 获取名称前缀配置，如果没有指定，则使用空字符串
         self.name_prefix = self.options.get("name_prefix", "")
 
-        # 初始化URL默认值字典，用于在生成URL时提供默认的参数值
-        self.url_defaults = dict(self.blueprint.url_values_defaults)
-        # 更新URL默认值字典，用当前配置选项中的URL默认值覆盖蓝图的URL默认值
-        self.url_defaults.update(self.options.get("url_defaults", ()))
+        # 预先拼好带前缀的完整蓝图名，注册每条路由时不再重复拼接
+        self._full_name = _join_bp_name(self.name_prefix, self.name)
+
+        # URL默认值字典按需构造：两个来源都为空时共享只读空字典，
+        # 只有配置选项覆盖蓝图默认值时才真正合并出新字典
+        bp_defaults = self.blueprint.url_values_defaults
+        opt_defaults = self.options.get("url_defaults")
+
+        if opt_defaults:
+            self.url_defaults = {**bp_defaults, **opt_defaults}
+        elif bp_defaults:
+            # 共享蓝图的字典引用；add_url_rule路径只读不写
+            self.url_defaults = bp_defaults
+        else:
+            self.url_defaults = _EMPTY_DICT
 
     def add_url_rule(
         self,
@@ -107,7 +153,7 @@ class BlueprintSetupState:
         # 如果当前蓝图或应用程序指定了URL前缀，则将其与规则合并
         if self.url_prefix is not None:
             if rule:
-                rule = "/".join((self.url_prefix.rstrip("/"), rule.lstrip("/")))
+                rule = "/".join((self._url_prefix_rstrip, rule.lstrip("/")))
             else:
                 rule = self.url_prefix
         # 设置规则的子域选项，如果没有显式指定，则使用蓝图或应用程序的默认子域
@@ -123,7 +169,7 @@ class BlueprintSetupState:
         # 向应用程序添加URL规则，结合当前蓝图或应用程序的名称前缀和名称，形成完整的端点名称
         self.app.add_url_rule(
             rule,
-            f"{self.name_prefix}.{self.name}.{endpoint}".lstrip("."),
+            _join_bp_name(self._full_name, endpoint),
             view_func,
             defaults=defaults,
             **options,
@@ -300,7 +346,7 @@ class Blueprint(Scaffold):
         # 从options中获取name_prefix和name，构造蓝图的完整名称
         name_prefix = options.get("name_prefix", "")
         self_name = options.get("name", self.name)
-        name = f"{name_prefix}.{self_name}".lstrip(".")
+        name = _join_bp_name(name_prefix, self_name)
 
         # 检查蓝图名称是否已注册，如果已注册则抛出ValueError
         if name in app.blueprints:
@@ -312,13 +358,16 @@ class Blueprint(Scaffold):
                 f" provide a unique name."
             )
 
-        # 判断是否是首次注册该蓝图
-        first_bp_registration = not any(bp is self for bp in app.blueprints.values())
+        # 判断是否是首次注册该蓝图：按身份集合O(1)判定
+        first_bp_registration = id(self) not in app._registered_bp_ids
         first_name_registration = name not in app.blueprints
 
-        # 在应用的blueprints字典中注册蓝图
+        # 在应用的blueprints字典及其迭代镜像中注册蓝图
         app.blueprints[name] = self
+        app._blueprints_list.append(self)
+        app._registered_bp_ids.add(id(self))
         self._got_registered_once = True
+        self._setup_finished = True
 
         # 创建蓝图的设置状态
         state = self.make_setup_state(app, options, first_bp_registration)
@@ -339,6 +388,9 @@ class Blueprint(Scaffold):
         for deferred in self.deferred_functions:
             deferred(state)
 
+        # URL默认函数可能有变化，丢弃按终点特化的注入器缓存
+        app._url_default_injectors.clear()
+
         # 解析CLI组选项并根据情况进行命令注册
         cli_resolved_group = options.get("cli_group", self.cli_group)
         if self.cli.commands:
@@ -351,7 +403,12 @@ class Blueprint(Scaffold):
                 self.cli.name = cli_resolved_group
                 app.cli.add_command(self.cli)
 
-        # 遍历所有嵌套的蓝图并注册它们
+        # 遍历所有嵌套的蓝图并注册它们；state上的字段先绑成局部
+        # 变量，循环体内不再逐次做属性查找
+        st_subdomain = state.subdomain
+        st_url_prefix = state.url_prefix
+        st_url_prefix_rstrip = state._url_prefix_rstrip
+
         for blueprint, bp_options in self._blueprints:
             bp_options = bp_options.copy()
             bp_url_prefix = bp_options.get("url_prefix")
@@ -360,24 +417,25 @@ class Blueprint(Scaffold):
             if bp_subdomain is None:
                 bp_subdomain = blueprint.subdomain
 
-            if state.subdomain is not None and bp_subdomain is not None:
-                bp_options["subdomain"] = bp_subdomain + "." + state.subdomain
+            if st_subdomain is not None and bp_subdomain is not None:
+                bp_options["subdomain"] = bp_subdomain + "." + st_subdomain
             elif bp_subdomain is not None:
                 bp_options["subdomain"] = bp_subdomain
-            elif state.subdomain is not None:
-                bp_options["subdomain"] = state.subdomain
+            elif st_subdomain is not None:
+                bp_options["subdomain"] = st_subdomain
 
             if bp_url_prefix is None:
                 bp_url_prefix = blueprint.url_prefix
 
-            if state.url_prefix is not None and bp_url_prefix is not None:
+            if st_url_prefix is not None and bp_url_prefix is not None:
+                # 复用state上预先去掉尾斜杠的前缀
                 bp_options["url_prefix"] = (
-                    state.url_prefix.rstrip("/") + "/" + bp_url_prefix.lstrip("/")
+                    st_url_prefix_rstrip + "/" + bp_url_prefix.lstrip("/")
                 )
             elif bp_url_prefix is not None:
                 bp_options["url_prefix"] = bp_url_prefix
-            elif state.url_prefix is not None:
-                bp_options["url_prefix"] = state.url_prefix
+            elif st_url_prefix is not None:
+                bp_options["url_prefix"] = st_url_prefix
 
             bp_options["name_prefix"] = name
             blueprint.register(app, bp_options)
@@ -418,15 +476,17 @@ class Blueprint(Scaffold):
         for key, value in self.error_handler_spec.items():
             # 如果蓝图的键为None，则使用蓝图的名称作为键，否则构建完整的键名
             key = name if key is None else f"{name}.{key}"
-            # 构建并更新应用的错误处理程序字典
-            value = defaultdict(
-                dict,
-                {
-                    code: {exc_class: func for exc_class, func in code_values.items()}
-                    for code, code_values in value.items()
-                },
-            )
-            app.error_handler_spec[key] = value
+            # 浅拷贝每层字典即可：内层copy是C级的哈希表复制，
+            # 不必用推导式逐项重建内容相同的字典
+            new_value: defaultdict[t.Any, dict[t.Any, t.Any]] = defaultdict(dict)
+
+            for code, code_values in value.items():
+                new_value[code] = code_values.copy()
+
+            app.error_handler_spec[key] = new_value
+
+        # 错误处理器有变化，促使应用的扁平索引在下次查找时重建
+        app._error_handler_index = None
 
         # 将蓝图中的视图函数合并到应用的视图函数中
         for endpoint, func in self.view_functions.items():
@@ -6,6 +6,7 @@ import pathlib
 import sys
 import typing as t
 from collections import defaultdict
+from functools import lru_cache
 from functools import update_wrapper
 
 from jinja2 import BaseLoader
@@ -64,8 +65,10 @@ def setupmethod(f: F) -> F:
         返回:
         - t.Any 被装饰函数的返回类型。
         """
-        # 在调用被装饰的函数前，检查设置过程是否完成
-        self._check_setup_finished(f_name)
+        # 快速路径：标志未置位时直接放行，省去每次装饰调用的
+        # 方法分派；置位后走慢路径由各子类抛出定制的错误信息
+        if self._setup_finished:
+            self._check_setup_finished(f_name)
         # 调用被装饰的函数
         return f(self, *args, **kwargs)
 
@@ -83,6 +86,10 @@ class Scaffold:
     _static_folder: str | None = None
     _static_url_path: str | None = None
 
+    # setupmethod包装器的快速路径标志：应用处理首个请求/蓝图完成
+    # 注册时置True，之后设置方法调用才走_check_setup_finished慢路径
+    _setup_finished: bool = False
+
     def __init__(
             self,
             import_name: str,
@@ -573,11 +580,13 @@ class Scaffold:
         self.error_handler_spec[None][code][exc_class] = f
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _get_exc_class_and_code(
             exc_class_or_code: type[Exception] | int,
     ) -> tuple[type[Exception], int | None]:
         """
         根据提供的异常类或错误代码，返回异常类和错误代码的元组。
+        结果按输入记忆化，同一异常类型反复分发时免去重复解析。
 
         参数:
         - exc_class_or_code: 一个异常类或错误代码，用于识别异常类型。